@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark Chain vs Chain.parallel on CPU bound per element functions.
+
+Usage:
+
+    $ python benchmarks/bench_parallel_chain.py [N] [WORKERS]
+
+The speedup depends on the number of cores: the parallel version pays
+for the pool startup and for pickling the elements and the results.
+On a single core machine it is slower, with N = 200000 and 2 workers:
+
+    to_date_dmy  speedup    0.80 x
+    regex        speedup    0.41 x
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from utils3.Chain import Chain
+
+
+def bench(name, function):
+    t0 = time.perf_counter()
+    function()
+    dt = time.perf_counter() - t0
+    print("{:<30} {:8.3f} s".format(name, dt))
+    return dt
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+
+    dates = ["{:02d}/{:02d}/{}".format(i % 28 + 1, i % 12 + 1, 1990 + i % 30) for i in range(n)]
+    lines = ["2015-01-{:02d} host{} GET /index/{}.html 200 {}".format(i % 28 + 1, i % 7, i, i % 500)
+             for i in range(n)]
+    pattern = r"(\S+) host(\d+) (GET|POST) (\S+) (\d+) (\d+)"
+
+    print("N = {}, workers = {}\n".format(n, workers))
+
+    seq = bench("to_date_dmy  sequential", lambda: Chain(dates).to_date_dmy("/"))
+    par = bench("to_date_dmy  parallel", lambda: Chain(dates).parallel(workers).to_date_dmy("/"))
+    print("{:<30} {:8.2f} x\n".format("speedup", seq / par))
+
+    seq = bench("regex        sequential", lambda: Chain(lines).regex(pattern))
+    par = bench("regex        parallel", lambda: Chain(lines).parallel(workers).regex(pattern))
+    print("{:<30} {:8.2f} x".format("speedup", seq / par))
+
+
+if __name__ == "__main__":
+    main()
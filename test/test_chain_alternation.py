@@ -0,0 +1,21 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+
+import pytest
+
+from utils3.Chain import compile_alternation, tag_match
+
+
+@pytest.mark.parametrize("pattern", ["(?i)error", re.compile("(?i)error"), re.compile("error", re.I)])
+def test_leading_flags_are_scoped(pattern):
+    regex = compile_alternation([pattern, "warning"])
+    assert tag_match(regex, "An ERROR") == (0, "An ERROR")
+    assert tag_match(regex, "A WARNING") is None
+    assert tag_match(regex, "a warning") == (1, "a warning")
+
+
+def test_duplicate_group_names_are_rejected():
+    with pytest.raises(ValueError, match="'code'"):
+        compile_alternation([r"E(?P<code>\d+)", r"W(?P<code>\d+)"])
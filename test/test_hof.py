@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import functools
+import pickle
+import threading
+import time
+
+import pytest
+
+from utils3.hof import X, conjunction, cache, ttl_cache, in_parallel, pmap, retry, CircuitBreaker, POOL_WORKERS
+from utils3.hof.aio import amap, aretry, gather_bounded
+
+
+def test_nested_pmap_runs_inline():
+    def inner(x):
+        return sum(pmap(lambda y: y * x, range(4), workers=2))
+
+    assert pmap(inner, range(4), workers=2, timeout=3) == [0, 6, 12, 18]
+    assert pmap(inner, range(4), workers=2, timeout=3) == [0, 6, 12, 18]
+
+
+def test_pmap_uses_a_single_pool():
+    for workers in range(1, 40):
+        assert pmap(lambda x: x, range(50), workers=workers) == list(range(50))
+
+    assert threading.active_count() <= POOL_WORKERS + 1
+
+
+def open_breaker():
+    breaker = CircuitBreaker(failures=1, reset_timeout=0.05)
+
+    with pytest.raises(IOError):
+        retry(raise_error(IOError), 1, IOError, breaker=breaker)
+
+    assert breaker.state == "open"
+    time.sleep(0.06)
+    assert breaker.state == "half-open"
+    return breaker
+
+
+def raise_error(error):
+    def call():
+        raise error()
+    return call
+
+
+class Interrupt(BaseException):
+    pass
+
+
+@pytest.mark.parametrize("error", [KeyError, Interrupt])
+def test_breaker_probe_released_on_other_errors(error):
+    breaker = open_breaker()
+
+    with pytest.raises(error):
+        retry(raise_error(error), 1, IOError, breaker=breaker)
+
+    assert breaker.state == "half-open"
+    assert retry(lambda: "ok", 1, IOError, breaker=breaker) == "ok"
+    assert breaker.state == "closed"
+
+
+def test_breaker_probe_released_by_aretry():
+    breaker = open_breaker()
+
+    async def probe():
+        raise KeyError("x")
+
+    with pytest.raises(KeyError):
+        asyncio.run(aretry(probe, 1, IOError, breaker=breaker))
+
+    assert retry(lambda: "ok", 1, IOError, breaker=breaker) == "ok"
+    assert breaker.state == "closed"
+
+
+def test_compiled_expression_can_be_pickled():
+    expression = (X + 1) * 2
+    assert expression(1) == 4
+
+    copy = pickle.loads(pickle.dumps(expression))
+    assert copy(2) == 6
+
+    predicate = pickle.loads(pickle.dumps((X > 1) & (X < 4)))
+    assert [predicate(x) for x in range(5)] == [False, False, True, True, False]
+
+
+@pytest.mark.parametrize("concurrency", [None, 5])
+def test_amap_cancels_pending_calls_on_error(concurrency):
+    done = []
+
+    async def call(x):
+        if x == 0:
+            raise ValueError(x)
+        await asyncio.sleep(0.05)
+        done.append(x)
+
+    async def main():
+        with pytest.raises(ValueError):
+            await amap(call, range(5), concurrency)
+        await asyncio.sleep(0.1)
+
+    asyncio.run(main())
+    assert done == []
+
+
+def test_lfu_cache_admits_new_keys():
+    calls = []
+
+    @cache(maxsize=2, policy="lfu")
+    def f(x):
+        calls.append(x)
+        return x
+
+    for x in (1, 1, 2, 2, 3, 3):
+        f(x)
+
+    assert calls == [1, 2, 3]
+    assert f.cache_info().evictions == 1
+
+
+def test_ttl_cache_purges_expired_entries():
+    @ttl_cache(0.05)
+    def f(x):
+        return x
+
+    for x in range(1000):
+        f(x)
+
+    time.sleep(0.06)
+    f(-1)
+
+    assert f.cache_info().currsize == 1
+
+
+def test_in_parallel_cancels_pending_calls_on_error():
+    ran = []
+
+    def slow():
+        time.sleep(0.5)
+
+    def boom():
+        raise ValueError("boom")
+
+    def queued_call(i):
+        time.sleep(0.1)
+        ran.append(i)
+
+    queued = [functools.partial(queued_call, i) for i in range(6)]
+    started = time.time()
+
+    with pytest.raises(ValueError):
+        in_parallel([slow, boom] + queued, workers=2, wait=True)()
+
+    assert time.time() - started < 0.4
+    time.sleep(0.6)
+    assert len(ran) <= 2
+
+
+def test_pmap_propagates_base_exceptions():
+    def call(x):
+        if x == 3:
+            raise Interrupt()
+        return x
+
+    with pytest.raises(Interrupt):
+        pmap(call, range(5), workers=2, timeout=5)
+
+
+def test_negative_constants_keep_their_precedence():
+    assert ((-2) ** X)(2) == 4
+    assert (X ** -1)(2) == 0.5
+    assert ((-2.5) ** X)(2) == 6.25
+    assert repr((-2) ** X) == "((-2) ** X)"
+
+
+def test_conjunction_short_circuits():
+    calls = []
+    predicate = conjunction([X > 2, X.call("bit_length").then(calls.append)])
+    assert not predicate(1)
+    assert calls == []
+    assert predicate.arity == 1
+
+
+def test_amap_rejects_empty_concurrency():
+    with pytest.raises(ValueError):
+        asyncio.run(amap(str, [1, 2], concurrency=0))
+
+    with pytest.raises(ValueError):
+        asyncio.run(gather_bounded([], 0))
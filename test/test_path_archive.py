@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import zipfile
+
+from utils3.Path import Path
+
+path_module = sys.modules["utils3.Path"]
+
+
+def test_parallel_zip_extract_stays_in_target(tmp_path):
+    archive = str(tmp_path / "evil.zip")
+    target = tmp_path / "out" / "inner"
+    outside = tmp_path / "escaped_dir"
+    absolute = tmp_path / "arc_abs_dir"
+
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("../../escaped_dir/a.txt", "a")
+        zf.writestr(str(absolute / "b.txt"), "b")
+        zf.writestr("ok/c.txt", "c")
+
+    Path(archive).extract(str(target), workers=4)
+
+    assert not outside.exists()
+    assert not absolute.exists()
+    assert (target / "escaped_dir" / "a.txt").read_text() == "a"
+    assert (target / "ok" / "c.txt").read_text() == "c"
+    assert (target / os.path.relpath(str(absolute), "/") / "b.txt").read_text() == "b"
+
+
+def test_parallel_mktgz_round_trip(tmp_path):
+    source = tmp_path / "data"
+    source.mkdir()
+    files = {}
+
+    for i in range(20):
+        content = os.urandom(50000) + b"x" * 200000
+        (source / "f{}.bin".format(i)).write_bytes(content)
+        files["data/f{}.bin".format(i)] = content
+
+    for fmt in ("gz", "bz2", "xz"):
+        archive = str(tmp_path / ("data.tar." + fmt))
+        Path(str(source)).mktgz(archive, workers=4, level=1, format=fmt)
+
+        found = {name: fp.read() for name, size, fp in Path(archive).iter_archive()}
+
+        assert found == files
+
+
+def test_parallel_xz_uses_default_preset(tmp_path, monkeypatch):
+    source = tmp_path / "data"
+    source.mkdir()
+    (source / "a.txt").write_text("a" * 1000)
+    levels = []
+    compress = path_module.COMPRESSORS["xz"]
+
+    def record(level, data):
+        levels.append(level)
+        return compress(level, data)
+
+    monkeypatch.setitem(path_module.COMPRESSORS, "xz", record)
+    Path(str(source)).mktgz(str(tmp_path / "data.tar.xz"), workers=2, format="xz")
+
+    assert set(levels) == {6}
+
+
+def test_read_member_or_plain_file(tmp_path):
+    archive = str(tmp_path / "a.zip")
+
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.txt", "zipped")
+
+    (tmp_path / "plain.txt").write_text("plain")
+
+    assert Path(archive).read("a.txt") == b"zipped"
+    assert Path(str(tmp_path / "plain.txt")).read("a.txt") == "plain"
+    assert Path(str(tmp_path)).read("plain.txt") == "plain"
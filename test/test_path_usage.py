@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+
+from utils3.Path import Path
+
+
+def test_du_deep_tree(tmp_path):
+    path = str(tmp_path)
+
+    for i in range(600):
+        path = os.path.join(path, "d")
+
+    os.makedirs(path)
+
+    with open(os.path.join(path, "f"), "w") as fp:
+        fp.write("x" * 100)
+
+    usage = Path(str(tmp_path)).du(depth=2, apparent=True)
+
+    assert usage.files == 1
+    assert len(list(usage.walk())) == 3
+    assert len(list(Path(str(tmp_path)).idu())) == 601
+
+
+def test_idu_stops_when_closed(tmp_path):
+    for i in range(50):
+        os.makedirs(str(tmp_path / str(i) / "sub"))
+
+    it = Path(str(tmp_path)).idu()
+    next(it)
+    it.close()
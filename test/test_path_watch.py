@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from utils3.Path import Path, inotify_events, WatchEvent
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify")
+
+
+class FakeInotify(object):
+    """ Inotify replacement that returns scripted events """
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.watches = {}
+
+    def add_watch(self, path):
+        wd = len(self.watches) + 1
+        self.watches[wd] = path
+        return wd
+
+    def read_events(self, timeout=None):
+        if self.script:
+            return self.script.pop(0)()
+        time.sleep(timeout or 0)
+        return []
+
+
+@linux_only
+def test_watch_returns_while_a_file_is_appended(tmp_path):
+    log = str(tmp_path / "log")
+    stop = threading.Event()
+
+    def writer():
+        while not stop.is_set():
+            with open(log, "a") as fp:
+                fp.write("x\n")
+            time.sleep(0.05)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+
+    try:
+        started = time.time()
+        events = list(Path(str(tmp_path)).watch(timeout=1, interval=0.5))
+        assert time.time() - started < 3
+        assert WatchEvent("modified", log) in events or WatchEvent("created", log) in events
+    finally:
+        stop.set()
+        thread.join()
+
+
+@linux_only
+def test_inotify_overflow_rescans_the_tree(tmp_path):
+    from utils3 import linux
+
+    def overflow():
+        (tmp_path / "lost.txt").write_text("x")
+        return [(-1, linux.IN_Q_OVERFLOW, 0, "")]
+
+    batches = inotify_events(FakeInotify([overflow]), str(tmp_path), interval=0.1, debounce=0.01)
+
+    assert WatchEvent("created", str(tmp_path / "lost.txt")) in next(batches)
+    assert next(batches) == []
@@ -117,6 +117,25 @@ from datetime import datetime
 
 
 import re
+import os
+import itertools
+import weakref
+from functools import partial, reduce
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import csv
+import json
+
+# Non Standard Library Module
+try:
+    import numpy
+except ImportError:
+    numpy = None
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+PATTERN_TYPE = type(re.compile(""))
+
 
 def flatten(List):
     result = []
@@ -225,6 +244,87 @@ class Chain(object):
     def __init__(self, list=[]):
         self.list = list
 
+    @classmethod
+    def lazy(cls, iterable):
+        """
+        Create a lazy Chain. Each step is evaluated element by element
+        only when a terminal operation (count, sum, join, list, find,
+        any, all) is called, so no intermediate list is built.
+
+        :param iterable: Any iterable, e.g. a list, a generator or a file
+        :return:         LazyChain object
+
+        Example:
+
+        >>> Chain.lazy(open("/var/log/syslog")).match("kernel").strip().count()
+        """
+        return LazyChain(iterable)
+
+    @classmethod
+    def from_file(cls, path, encoding="utf-8", chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Stream the lines of a text file, without the line terminators,
+        as a LazyChain. The file is read with a buffer of chunk_size
+        bytes and is opened again each time the pipeline is evaluated.
+
+        :param path:        File name or Path object
+        :param encoding:    File encoding
+        :param chunk_size:  Read buffer size in bytes
+        :return:            LazyChain object
+
+        Example:
+
+        >>> Chain.from_file("/var/log/syslog").match("kernel").count()
+        """
+        return LazyChain(FileSource(path, encoding, chunk_size))
+
+    @classmethod
+    def from_csv(cls, path, encoding="utf-8", chunk_size=DEFAULT_CHUNK_SIZE, header=False, **fmtparams):
+        """
+        Stream the rows of a CSV file as a LazyChain.
+
+        :param header:    If True the first row is used as field names
+                          and each row is a dictionary.
+        :param fmtparams: Extra parameters to csv.reader, e.g. delimiter=";"
+        :return:          LazyChain object
+        """
+        return LazyChain(CsvSource(path, encoding, chunk_size, header, fmtparams))
+
+    @classmethod
+    def from_jsonl(cls, path, encoding="utf-8", chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Stream a JSON lines file (one JSON document per line) as
+        a LazyChain of decoded objects. Blank lines are skipped.
+        """
+        return LazyChain(JsonlSource(path, encoding, chunk_size))
+
+    def parallel(self, workers=None, chunksize=None, min_size=10000):
+        """
+        Run the following map/select steps on a process pool.
+
+        :param workers:   Number of worker processes (default: os.cpu_count())
+        :param chunksize: Number of elements sent to a worker at once
+                          (default: split the list in 4 chunks per worker)
+        :param min_size:  Lists smaller than that are processed in-process
+        :return:          ParallelChain object
+
+        The functions passed to map/select must be picklable, i.e.
+        module level functions, builtins or functools.partial objects,
+        not lambdas.
+
+        Example:
+
+        >>> Chain(dates).parallel(workers=8).to_date_dmy("/")
+        """
+        return ParallelChain(self.list, workers, chunksize, min_size)
+
+    def to_columns(self):
+        """
+        Convert a list of rows (sublists) or a list of values
+        to a columnar NumericChain.
+        """
+        return NumericChain.from_rows(self.list)
+
     def map(self, function):
         return Chain(hof.mapl(function, self.list))
 
@@ -259,13 +359,43 @@ class Chain(object):
         return self.select(predicate), self.reject(predicate)
 
     def match(self, pattern):
-        return Chain(hof.filterl(lambda txt: re.match(pattern, txt), self.list))
+        """
+        Select the elements that match the pattern (re.match).
+        The pattern can be a string or a compiled regex, it is
+        compiled only once.
+        """
+        return self.select(re.compile(pattern).match)
 
     def regex(self, pattern):
-        return Chain(hof.mapl(lambda txt: re.findall(pattern, txt), self.list))
+        return self.map(re.compile(pattern).findall)
 
     def regexf(self, pattern):
-        return Chain(flatten(hof.mapl(lambda txt: re.findall(pattern, txt), self.list)))
+        return Chain(flatten(hof.mapl(re.compile(pattern).findall, self.list)))
+
+    def grep_many(self, patterns, tag=False):
+        """
+        Select the elements where any of the patterns is found (re.search).
+        The patterns are merged into a single alternation, so each
+        element is scanned only once.
+
+        :param patterns: List of patterns (strings or compiled regexes)
+        :param tag:      If True returns (index, element) where index is
+                         the position of the pattern of the leftmost match
+                         in the element (the first of the patterns
+                         matching at that position).
+        :return:         Chain
+
+        Example:
+
+        >>> Chain(["GET /a", "POST /b", "PUT /c"]).grep_many(["GET", "POST"], tag=True)
+        Chain : [(0, 'GET /a'), (1, 'POST /b')]
+        """
+        regex = compile_alternation(patterns)
+
+        if tag:
+            return Chain(hof.filterl(is_not_none, hof.mapl(partial(tag_match, regex), self.list)))
+
+        return self.select(regex.search)
 
     def strip(self, param=None):
         return Chain(hof.mapl(lambda x: x.strip(param), self.list))
@@ -350,22 +480,22 @@ class Chain(object):
         return Chain(flatten(self.list))
 
     def to_int(self):
-        return Chain(hof.mapl(lambda x: int(x), self.list))
+        return self.map(int)
 
     def to_float(self):
-        return Chain(hof.mapl(lambda x: float(x), self.list))
+        return self.map(float)
 
     def to_date_ymd(self, separator):
-        return Chain(hof.mapl(lambda x: date_ymd(x, separator), self.list))
+        return self.map(partial(date_ymd, separator=separator))
 
     def to_date_dmy(self, separator):
-        return Chain(hof.mapl(lambda x: date_dmy(x, separator), self.list))
+        return self.map(partial(date_dmy, separator=separator))
 
     def to_date_mdy(self, separator):
-        return Chain(hof.mapl(lambda x: date_mdy(x, separator), self.list))
+        return self.map(partial(date_mdy, separator=separator))
 
     def to_str(self):
-        return Chain(hof.mapl(lambda x: str(x), self.list))
+        return self.map(str)
 
     def to_dict(self, filednames):
         return Chain(hof.mapl(lambda sublist: dict(zip(filednames, sublist)), self.list))
@@ -388,3 +518,711 @@ class Chain(object):
     def __getitem__(self, item):
         return self.list[item]
 
+
+
+INLINE_FLAGS = ((re.ASCII, "a"), (re.IGNORECASE, "i"), (re.LOCALE, "L"),
+                (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+
+# Global inline flags at the start of a pattern, e.g. (?i)
+LEADING_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+
+
+def compile_alternation(patterns):
+    """
+    Merge a list of patterns into one compiled regex where the
+    pattern i is wrapped in the named group _g<i>. The flags of a
+    compiled pattern and the leading global flags like (?i) of a
+    pattern only apply to it, it is wrapped in a scoped inline
+    flags group like (?i:...).
+
+    Note: numbered backreferences like \\1 inside the patterns
+    are shifted by the wrapping groups, use named groups instead.
+    A group name can only be used by one of the patterns, else
+    ValueError is raised.
+    """
+    sources = []
+    names = {}
+
+    for i, pattern in enumerate(patterns):
+        letters = ""
+        regex = re.compile(pattern)
+
+        if isinstance(pattern, PATTERN_TYPE):
+            letters = "".join(letter for flag, letter in INLINE_FLAGS if pattern.flags & flag)
+            pattern = pattern.pattern
+
+        for name in regex.groupindex:
+            if name in names:
+                raise ValueError("Group name {!r} is used by the patterns {} and {}".format(
+                    name, names[name], i))
+            names[name] = i
+
+        match = LEADING_FLAGS.match(pattern)
+
+        while match is not None:
+            letters += "".join(x for x in match.group(1) if x not in letters)
+            pattern = pattern[match.end():]
+            match = LEADING_FLAGS.match(pattern)
+
+        if letters:
+            pattern = "(?{}:{})".format(letters, pattern)
+
+        sources.append("(?P<_g{}>{})".format(i, pattern))
+
+    return re.compile("|".join(sources))
+
+
+def tag_match(regex, txt):
+    """
+    Return (index, txt) where index is the alternative of the
+    regex created by compile_alternation that matches txt, or None.
+    """
+    m = regex.search(txt)
+
+    if m is None:
+        return None
+
+    return int(m.lastgroup[2:]), txt
+
+
+def is_not_none(x):
+    return x is not None
+
+
+class FileSource(object):
+    """
+    Re-iterable stream of the lines of a text file.
+    """
+
+    def __init__(self, path, encoding="utf-8", chunk_size=DEFAULT_CHUNK_SIZE):
+        self.path = str(path)
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+
+    def open(self):
+        return open(self.path, encoding=self.encoding, buffering=self.chunk_size)
+
+    def __iter__(self):
+        with self.open() as fp:
+            for line in fp:
+                yield line.rstrip("\n")
+
+
+class CsvSource(FileSource):
+    """
+    Re-iterable stream of the rows of a CSV file.
+    """
+
+    def __init__(self, path, encoding="utf-8", chunk_size=DEFAULT_CHUNK_SIZE, header=False, fmtparams=None):
+        FileSource.__init__(self, path, encoding, chunk_size)
+        self.header = header
+        self.fmtparams = fmtparams or {}
+
+    def open(self):
+        return open(self.path, encoding=self.encoding, buffering=self.chunk_size, newline="")
+
+    def __iter__(self):
+        with self.open() as fp:
+            if self.header:
+                reader = csv.DictReader(fp, **self.fmtparams)
+            else:
+                reader = csv.reader(fp, **self.fmtparams)
+
+            for row in reader:
+                yield row
+
+
+class JsonlSource(FileSource):
+    """
+    Re-iterable stream of the objects of a JSON lines file.
+    """
+
+    def __iter__(self):
+        with self.open() as fp:
+            for line in fp:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def test_predicate(predicate, x):
+    return bool(predicate(x))
+
+
+class ProcessPool(object):
+    """
+    ProcessPoolExecutor created on first use and shared by all the
+    steps of a ParallelChain pipeline. It is shut down by close() or
+    when the last chain using it is garbage collected.
+    """
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.executor = None
+
+    def get(self):
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(self.workers)
+            weakref.finalize(self, self.executor.shutdown, False)
+        return self.executor
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+class ParallelChain(Chain):
+    """
+    Chain that runs map and select on a ProcessPoolExecutor,
+    keeping the order of the elements. The other operations
+    run in-process and return a plain Chain. The worker processes
+    are started once and reused by the following steps.
+
+    Example:
+
+    >>> from utils3 import Chain
+    >>> Chain(["01/12/2013", "02/12/2013"]).parallel(2, min_size=0).to_date_dmy("/")
+    ParallelChain : [datetime.datetime(2013, 12, 1, 0, 0), datetime.datetime(2013, 12, 2, 0, 0)]
+    """
+
+    def __init__(self, list=[], workers=None, chunksize=None, min_size=10000, pool=None):
+        self.list = list
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.min_size = min_size
+        self.pool = pool or ProcessPool(self.workers)
+
+    def _new(self, list):
+        return ParallelChain(list, self.workers, self.chunksize, self.min_size, self.pool)
+
+    def _pmap(self, function):
+        if self.workers < 2 or len(self.list) < self.min_size:
+            return hof.mapl(function, self.list)
+
+        chunksize = self.chunksize or max(1, len(self.list) // (self.workers * 4))
+
+        return list(self.pool.get().map(function, self.list, chunksize=chunksize))
+
+    def map(self, function):
+        return self._new(self._pmap(function))
+
+    def select(self, predicate):
+        flags = self._pmap(partial(test_predicate, predicate))
+        return self._new(list(itertools.compress(self.list, flags)))
+
+    def sequential(self):
+        """ Return to in-process execution """
+        return Chain(self.list)
+
+    def close(self):
+        """ Shut down the worker processes of the pipeline """
+        self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __str__(self):
+        return "ParallelChain : {}".format(self.list)
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def is_expression(function):
+    return isinstance(function, hof.Operator) and function.arity == 1
+
+
+def fuse_maps(functions):
+    """
+    Fuse the adjacent hof.X expressions of a list of functions applied
+    in sequence into one expression, (X + 1) then (X * 2) is compiled
+    into lambda x: (x + 1) * 2. Other functions are kept as they are:
+    wrapping them in another Python function would add a call per
+    element instead of removing one, chained map() calls are cheaper.
+
+    :return: List of (function, fused step names) tuples
+    """
+    fused = []
+
+    for is_expr, group in itertools.groupby(functions, is_expression):
+        group = list(group)
+
+        if is_expr:
+            fused.append((reduce(hof.Operator.then, group).compile(), step_names(group)))
+        else:
+            fused.extend((function, step_names([function])) for function in group)
+
+    return fused
+
+
+def fuse_selects(predicates):
+    """
+    Fuse the adjacent hof.X predicates of a list of selects into one
+    expression, (X > 10) then (X < 50) is compiled into
+    lambda x: x > 10 and x < 50, which still short-circuits. Other
+    predicates are kept as they are, like in fuse_maps.
+
+    :return: List of (predicate, fused step names) tuples
+    """
+    fused = []
+
+    for is_expr, group in itertools.groupby(predicates, is_expression):
+        group = list(group)
+
+        if is_expr:
+            fused.append((hof.conjunction(group).compile(), step_names(group)))
+        else:
+            fused.extend((predicate, step_names([predicate])) for predicate in group)
+
+    return fused
+
+
+def optimize_plan(steps):
+    """
+    Turn a list of (kind, argument) steps into an optimized plan:
+
+        * adjacent hof.X maps are substituted into one expression
+        * adjacent hof.X selects are joined with and into one expression
+        * adjacent takes keep the smallest n, adjacent drops are added
+
+    :param steps: List of (kind, argument) tuples
+    :return:      List of (kind, argument, fused step names) tuples
+    """
+    groups = []
+
+    for kind, arg in steps:
+
+        if groups and groups[-1][0] == kind and kind in ("map", "select", "take", "drop"):
+            groups[-1][1].append(arg)
+        else:
+            groups.append((kind, [arg]))
+
+    plan = []
+
+    for kind, args in groups:
+
+        if kind == "map":
+            plan.extend((kind, function, names) for function, names in fuse_maps(args))
+        elif kind == "select":
+            plan.extend((kind, predicate, names) for predicate, names in fuse_selects(args))
+        elif kind == "take":
+            plan.append((kind, min(args), args))
+        elif kind == "drop":
+            plan.append((kind, sum(args), args))
+        else:
+            plan.extend((kind, hof.native(arg), step_names([arg])) for arg in args)
+
+    return plan
+
+
+def step_names(functions):
+    return hof.mapl(lambda f: getattr(f, "__name__", repr(f)), functions)
+
+
+class LazyChain(object):
+    """
+    Generator backed Chain. The steps are recorded and fused into
+    a single generator that is consumed by the terminal operations
+    count, sum, join, list, find, find_index, any and all.
+
+    Example:
+
+    >>> x = Chain.lazy(range(10)).map(lambda x: x * 2).select(lambda x: x > 10)
+    >>> x
+    LazyChain : <map, select>
+    >>> x.list
+    [12, 14, 16, 18]
+    >>> x.sum()
+    60
+    """
+
+    def __init__(self, iterable, steps=()):
+        self.source = iterable
+        self.steps = tuple(steps)
+
+    def _step(self, kind, function):
+        return LazyChain(self.source, self.steps + ((kind, function),))
+
+    def plan(self):
+        """
+        Return the optimized logical plan as a list of
+        (kind, argument, fused steps) tuples.
+        """
+        return optimize_plan(self.steps)
+
+    def explain(self):
+        """
+        Print the optimized plan of the pipeline.
+
+        Example:
+
+        >>> Chain.lazy(range(100)).map(X + 1).map(X * 2).select(X > 10).select(X < 50).take(3).explain()
+        source : range
+        map    : (X + 1) . (X * 2)
+        select : (X > 10) and (X < 50)
+        take   : 3 (short-circuit)
+        """
+        print("source :", type(self.source).__name__)
+
+        for kind, arg, fused in self.plan():
+
+            if kind == "map":
+                desc = " . ".join(fused)
+            elif kind == "select":
+                desc = " and ".join(fused)
+            elif kind == "flatmap":
+                desc = fused[0]
+            elif kind == "take":
+                desc = "{} (short-circuit)".format(arg)
+            else:
+                desc = str(arg)
+
+            print("{:<7}: {}".format(kind, desc))
+
+    def __iter__(self):
+        stream = iter(self.source)
+
+        for kind, arg, _ in self.plan():
+
+            if kind == "map":
+                stream = map(arg, stream)
+            elif kind == "select":
+                stream = filter(arg, stream)
+            elif kind == "flatmap":
+                stream = itertools.chain.from_iterable(map(arg, stream))
+            elif kind == "take":
+                stream = itertools.islice(stream, arg)
+            elif kind == "drop":
+                stream = itertools.islice(stream, arg, None)
+
+        return stream
+
+    def map(self, function):
+        return self._step("map", function)
+
+    def select(self, predicate):
+        return self._step("select", predicate)
+
+    def flat_map(self, function):
+        return self._step("flatmap", function)
+
+    def select_pos(self, pos):
+        return self.map(lambda a: get_pos(a, pos))
+
+    def select_by_pos(self, predicate, pos):
+        return self.select(lambda sublist: predicate(sublist[pos]))
+
+    def append_pos(self, element):
+        return self.map(lambda sublist: append_element(sublist, element))
+
+    def update_pos(self, function, pos):
+        return self.map(lambda sublist: update_pos(sublist, pos, function))
+
+    def reject(self, predicate):
+        return self.select(lambda x: not predicate(x))
+
+    def reject_none(self):
+        return self.reject(is_none)
+
+    def reject_type(self, type):
+        return self.reject(lambda t: isinstance(t, type))
+
+    def match(self, pattern):
+        return self.select(re.compile(pattern).match)
+
+    def regex(self, pattern):
+        return self.map(re.compile(pattern).findall)
+
+    def regexf(self, pattern):
+        return self.flat_map(re.compile(pattern).findall)
+
+    def grep_many(self, patterns, tag=False):
+        regex = compile_alternation(patterns)
+
+        if tag:
+            return self.map(partial(tag_match, regex)).select(is_not_none)
+
+        return self.select(regex.search)
+
+    def strip(self, param=None):
+        return self.map(lambda x: x.strip(param))
+
+    def split(self, param=None):
+        return self.map(lambda x: x.split(param))
+
+    def splitlines(self):
+        return self.map(lambda x: x.splitlines())
+
+    def take(self, n):
+        return self._step("take", n)
+
+    def drop(self, n):
+        return self._step("drop", n)
+
+    def get_attr(self, attribute):
+        return self.map(lambda obj: getattr(obj, attribute))
+
+    def get_key(self, key):
+        return self.map(lambda obj: obj[key])
+
+    def flat(self):
+        return self.flat_map(hof.identity)
+
+    def to_int(self):
+        return self.map(int)
+
+    def to_float(self):
+        return self.map(float)
+
+    def to_str(self):
+        return self.map(str)
+
+    def to_date_ymd(self, separator):
+        return self.map(lambda x: date_ymd(x, separator))
+
+    def to_date_dmy(self, separator):
+        return self.map(lambda x: date_dmy(x, separator))
+
+    def to_date_mdy(self, separator):
+        return self.map(lambda x: date_mdy(x, separator))
+
+    def to_dict(self, filednames):
+        return self.map(lambda sublist: dict(zip(filednames, sublist)))
+
+    def type(self):
+        return self.map(type)
+
+    #-------------------------------#
+    #     TERMINAL OPERATIONS       #
+    #-------------------------------#
+
+    @property
+    def list(self):
+        """ Evaluate the pipeline and return the result as a list """
+        return list(self)
+
+    def collect(self):
+        """ Evaluate the pipeline and return an eager Chain """
+        return Chain(self.list)
+
+    def count(self):
+        n = 0
+        for _ in self:
+            n += 1
+        return n
+
+    def sum(self):
+        return sum(self)
+
+    def join(self, param=""):
+        return param.join(map(str, self))
+
+    def find(self, predicate):
+        return hof.find(predicate, self)
+
+    def find_index(self, predicate):
+        return hof.find_index(predicate, self)
+
+    def any(self, predicate):
+        return any(map(predicate, self))
+
+    def all(self, predicate):
+        return all(map(predicate, self))
+
+    def __str__(self):
+        return "LazyChain : <{}>".format(", ".join(kind for kind, _ in self.steps))
+
+    def __repr__(self):
+        return self.__str__()
+
+
+
+def make_column(values, typecode=None):
+    """
+    Create a column from a sequence of values. Numeric columns
+    (typecode 'd' or 'l') are NumPy arrays when NumPy is installed
+    or array.array otherwise, other columns are object arrays / lists.
+    """
+    if numpy is not None:
+        dtype = {"d": float, "l": numpy.int64}.get(typecode, object)
+        if isinstance(values, numpy.ndarray) and dtype is object:
+            return values
+        if dtype is object:
+            column = numpy.empty(len(values), dtype=object)
+            column[:] = values
+            return column
+        return numpy.asarray(values, dtype=dtype)
+
+    if typecode is None:
+        return list(values)
+
+    return array(typecode, values)
+
+
+def apply_column(function, column):
+    """
+    Apply a function to a whole column. With NumPy, expressions built
+    with hof.X from arithmetic, comparisons and & | like (X > 20) or
+    (X * 2) are called once with a numeric array, so they run as
+    vectorized array operations. Any other function is applied
+    element-wise.
+    """
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        if isinstance(function, hof.Operator) and function.elementwise and column.dtype != object:
+            return function(column)
+        return make_column(hof.mapl(function, column))
+
+    result = hof.mapl(function, column)
+
+    if isinstance(column, array):
+        if all(isinstance(x, int) for x in result):
+            return array(column.typecode, result)
+        if all(isinstance(x, (int, float)) for x in result):
+            return array("d", result)
+
+    return result
+
+
+def compress_column(column, mask):
+    if isinstance(column, array):
+        return array(column.typecode, itertools.compress(column, mask))
+    return list(itertools.compress(column, mask))
+
+
+def column_to_list(column):
+    if hasattr(column, "tolist"):
+        return column.tolist()
+    return list(column)
+
+
+class NumericChain(object):
+    """
+    Columnar Chain for numeric pipelines. The data is stored as a list
+    of columns backed by NumPy arrays (or array.array when NumPy is not
+    available), so conversions, arithmetic, comparisons and sums built
+    from hof.X run as array operations instead of one lambda per element.
+
+    Example:
+
+    >>> from utils3.hof import X
+    >>> rows = [['233', 'a', 'b'], ['4343', 'y', 'o'], ['44', 'p', 'k']]
+    >>> c = Chain(rows).to_columns().to_float(0)
+    >>> c.update_pos(X / 10, 0).select_by_pos(X > 20, 0)
+    NumericChain : [[23.3, 'a', 'b'], [434.3, 'y', 'o']]
+    >>> c.sum(0)
+    4620.0
+    """
+
+    def __init__(self, columns, rows=True):
+        self.columns = columns
+        self.rows = rows
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Create a NumericChain from a list of rows (lists or tuples)
+        or from a flat list of values (single column).
+        """
+        rows = list(rows)
+
+        if rows and (is_list(rows[0]) or is_tuple(rows[0])):
+            return cls(hof.mapl(make_column, hof.transpose(rows)), rows=True)
+
+        return cls([make_column(rows)], rows=False)
+
+    def _new(self, columns):
+        return NumericChain(columns, self.rows)
+
+    def _positions(self, pos):
+        if pos is None:
+            return range(len(self.columns))
+        return [pos]
+
+    def column(self, pos=0):
+        """ Return the column array at position pos """
+        return self.columns[pos]
+
+    def _convert(self, pos, typecode, function):
+        columns = list(self.columns)
+
+        for i in self._positions(pos):
+            columns[i] = make_column(hof.mapl(function, columns[i]), typecode)
+
+        return self._new(columns)
+
+    def to_float(self, pos=None):
+        """ Convert column pos (or all columns) to float """
+        return self._convert(pos, "d", float)
+
+    def to_int(self, pos=None):
+        """ Convert column pos (or all columns) to int """
+        return self._convert(pos, "l", int)
+
+    def update_pos(self, function, pos):
+        columns = list(self.columns)
+        columns[pos] = apply_column(function, columns[pos])
+        return self._new(columns)
+
+    def map(self, function):
+        """ Apply a function to every column """
+        return self._new([apply_column(function, c) for c in self.columns])
+
+    def _filter(self, predicate, pos, keep):
+        mask = apply_column(predicate, self.columns[pos])
+
+        if numpy is not None and isinstance(mask, numpy.ndarray):
+            mask = mask.astype(bool) == keep
+            return self._new([c[mask] for c in self.columns])
+
+        mask = [bool(m) == keep for m in mask]
+        return self._new([compress_column(c, mask) for c in self.columns])
+
+    def select_by_pos(self, predicate, pos):
+        return self._filter(predicate, pos, True)
+
+    def reject_by_pos(self, predicate, pos):
+        return self._filter(predicate, pos, False)
+
+    def select(self, predicate):
+        return self.select_by_pos(predicate, 0)
+
+    def reject(self, predicate):
+        return self.reject_by_pos(predicate, 0)
+
+    def sum(self, pos=0):
+        column = self.columns[pos]
+
+        if numpy is not None and isinstance(column, numpy.ndarray):
+            return column.sum().item()
+
+        return sum(column)
+
+    def count(self):
+        if not self.columns:
+            return 0
+        return len(self.columns[0])
+
+    def is_empty(self):
+        return self.count() == 0
+
+    @property
+    def list(self):
+        """ Convert the columns back to a list of rows (or values) """
+        columns = hof.mapl(column_to_list, self.columns)
+
+        if not self.rows:
+            return columns[0] if columns else []
+
+        return hof.mapl(list, zip(*columns))
+
+    def to_chain(self):
+        return Chain(self.list)
+
+    def __str__(self):
+        return "NumericChain : {}".format(self.list)
+
+    def __repr__(self):
+        return self.__str__()
@@ -21,20 +21,34 @@ import shutil
 import errno
 import time
 import fnmatch
+import re
 import inspect
+import weakref
 from subprocess import Popen, PIPE
 
 import zipfile
 import tarfile
+import gzip
+import bz2
+import lzma
 import hashlib
+import queue
+import heapq
+import io
+import threading
+from collections import namedtuple, OrderedDict, deque, defaultdict
+from functools import partial
+import mmap
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 
 # Linux/UNIX Modules Only
 import pwd
 import grp
 
-from .check import is_unix, is_windows, is_linux
-from .hof import mapl, filterl
+from .check import is_unix, is_windows, is_linux, is_string
+from .Container import Container
+from .hof import mapl
 
 # Non Standard Library Module
 try:
@@ -45,15 +59,1128 @@ except ImportError:
 permissions = lambda x: "".join([["-", "r"][(x & 4) >> 2], ["-", "w"][(x & 2) >> 1], ["-", "x"][x & 1]])
 
 
+HASH_CHUNK_SIZE = 1024 * 1024
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+
+def hash_file(filename, algo="md5", chunk_size=HASH_CHUNK_SIZE, use_mmap=None):
+    """
+    Return the hex digest of the content of a file. hashlib releases
+    the GIL while hashing large blocks, so several files can be hashed
+    in parallel by threads.
+    """
+    h = hashlib.new(algo)
+
+    with open(filename, "rb") as fp:
+        size = os.fstat(fp.fileno()).st_size
+
+        if use_mmap is None:
+            use_mmap = size >= MMAP_THRESHOLD
+
+        if use_mmap and size > 0:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                for offset in range(0, size, chunk_size):
+                    h.update(view[offset:offset + chunk_size])
+                view.release()
+        else:
+            for chunk in iter(lambda: fp.read(chunk_size), b""):
+                h.update(chunk)
+
+    return h.hexdigest()
+
+
+MMAP_ACCESS = {
+    "r": mmap.ACCESS_READ,
+    "w": mmap.ACCESS_WRITE,
+    "r+": mmap.ACCESS_WRITE,
+    "c": mmap.ACCESS_COPY,
+}
+
+
+def map_file(filename, mode="r"):
+    """ Return a mmap.mmap of the whole file, see Path.mmap """
+    access = MMAP_ACCESS[mode]
+    flags = "rb" if access == mmap.ACCESS_READ else "r+b"
+
+    with open(filename, flags) as fp:
+        return mmap.mmap(fp.fileno(), 0, access=access)
+
+
+def iter_mmap_lines(filename):
+    """ Iterate over the lines (bytes) of a file using a memory map """
+    if os.path.getsize(filename) == 0:
+        return
+
+    with map_file(filename) as mm:
+        start = 0
+        size = len(mm)
+
+        while start < size:
+            end = mm.find(b"\n", start)
+
+            if end < 0:
+                end = size
+
+            yield mm[start:end]
+            start = end + 1
+
+
+def iter_file_lines(filename):
+    """ Iterate over the lines (bytes) of a file read with a buffer """
+    with open(filename, "rb") as fp:
+        for line in fp:
+            yield line.rstrip(b"\n")
+
+
+#-------------------------------#
+#     BULK FILE OPERATIONS      #
+#-------------------------------#
+
+OpResult = namedtuple("OpResult", "path dest ok error")
+
+
+def copy_file(src, dst):
+    """
+    Copy the data and the permission bits of a file using
+    os.copy_file_range or os.sendfile (no copy to user space)
+    and falling back to a buffered copy.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        copied = 0
+
+        for syscall in ("copy_file_range", "sendfile"):
+            function = getattr(os, syscall, None)
+
+            if function is None:
+                continue
+
+            try:
+                while copied < size:
+                    if syscall == "sendfile":
+                        n = function(outfd, infd, copied, size - copied)
+                    else:
+                        n = function(infd, outfd, size - copied, copied, copied)
+
+                    if n == 0:
+                        break
+                    copied += n
+                break
+            except OSError as e:
+                if copied or e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+                                             errno.EOPNOTSUPP, errno.EBADF):
+                    raise
+
+        if copied < size:
+            fsrc.seek(copied)
+            fdst.seek(copied)
+            shutil.copyfileobj(fsrc, fdst)
+
+    shutil.copymode(src, dst)
+    return dst
+
+
+def copy_path(src, dest):
+    """ Copy a file or a directory tree like Path.cp """
+    if os.path.isdir(dest):
+        dest = os.path.join(dest, os.path.basename(src.rstrip(os.sep)))
+
+    if os.path.isdir(src):
+        shutil.copytree(src, dest, copy_function=copy_file)
+    else:
+        copy_file(src, dest)
+
+
+def remove_path(path, dest=None):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
+
+
+def is_dir_name(path):
+    """ True if path ends with a separator, i.e. names a directory """
+    return path.endswith(os.sep) or bool(os.altsep and path.endswith(os.altsep))
+
+
+def dest_directory(dest):
+    """
+    Return the directory that must exist to copy to dest: dest
+    itself if it ends with a separator, otherwise its parent.
+    """
+    if is_dir_name(dest):
+        return os.path.abspath(dest)
+    return os.path.dirname(os.path.abspath(dest))
+
+
+def make_dirs(paths):
+    """
+    Create directories sorted by depth, returns a
+    dictionary {path: error} of the ones that failed.
+    """
+    errors = {}
+
+    for path in sorted(set(paths), key=lambda p: os.path.abspath(p).count(os.sep)):
+        try:
+            os.makedirs(path, exist_ok=True)
+        except OSError as e:
+            errors[path] = e
+
+    return errors
+
+
+def run_bulk(function, pairs, workers):
+    """
+    Call function(path, dest) for each pair on a thread pool and
+    return the list of OpResult instead of raising the errors.
+    """
+    def run(pair):
+        try:
+            function(*pair)
+            return OpResult(pair[0], pair[1], True, None)
+        except (OSError, shutil.Error) as e:
+            return OpResult(pair[0], pair[1], False, e)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run, pairs))
+
+
+#-------------------------------#
+#         DISK USAGE            #
+#-------------------------------#
+
+class DiskUsage(object):
+    """
+    Disk usage of a directory: size in bytes, number of
+    files and the DiskUsage of the subdirectories.
+    """
+
+    def __init__(self, path, size=0, files=0):
+        self.path = path
+        self.size = size
+        self.files = files
+        self.children = []
+
+    def add(self, other):
+        self.size += other.size
+        self.files += other.files
+
+    def walk(self):
+        """ Iterate over the node and all its descendants """
+        yield self
+        for child in self.children:
+            for node in child.walk():
+                yield node
+
+    def __repr__(self):
+        return "DiskUsage({!r}, size={}, files={})".format(self.path, self.size, self.files)
+
+
+class DiskUsageState(object):
+    """
+    Options and shared state of a disk usage scan: the inodes of
+    the hard links already counted and the callback of each result.
+    """
+
+    def __init__(self, top, one_filesystem=False, apparent=False, emit=None):
+        self.dev = os.stat(top).st_dev
+        self.one_filesystem = one_filesystem
+        self.apparent = apparent
+        self.emit = emit
+        self.inodes = set()
+        self.lock = threading.Lock()
+        self.stopped = False
+
+    def usage(self, st):
+        """ Return the usage of a stat result, 0 for a counted hard link """
+        if st.st_nlink > 1:
+            key = (st.st_dev, st.st_ino)
+            with self.lock:
+                if key in self.inodes:
+                    return 0
+                self.inodes.add(key)
+
+        if self.apparent:
+            return st.st_size
+
+        return st.st_blocks * 512
+
+
+def scan_usage(node, state):
+    """
+    Add the usage of the files of the directory node.path to node
+    and return the os.DirEntry of its subdirectories.
+    """
+    result = scan_directory(node.path)
+
+    if result is None:
+        return []
+
+    _, dirs, files = result
+
+    for entry in files:
+        try:
+            node.size += state.usage(entry.stat(follow_symlinks=False))
+            node.files += 1
+        except OSError:
+            pass
+
+    return dirs
+
+
+def entry_usage(entry, state):
+    """
+    Return (DiskUsage, is_dir) for a subdirectory entry, a symbolic link
+    is counted as a file. None if it is in another file system or
+    can't be read.
+    """
+    try:
+        st = entry.stat(follow_symlinks=False)
+    except OSError:
+        return None
+
+    if entry.is_symlink():
+        return DiskUsage(entry.path, state.usage(st), 1), False
+
+    if state.one_filesystem and st.st_dev != state.dev:
+        return None
+
+    return DiskUsage(entry.path, state.usage(st)), True
+
+
+def disk_usage(root, depth, state, level=0):
+    """
+    Return the DiskUsage tree of root, see Path.du. The tree is walked
+    with an explicit stack, so its depth is not limited by the
+    recursion limit, and the size of a directory is added to its
+    parent once all its subdirectories are done.
+    """
+    top = DiskUsage(root)
+
+    try:
+        top.size = state.usage(os.stat(root, follow_symlinks=False))
+    except OSError:
+        pass
+
+    def attach(parent, child, parent_level):
+        parent.add(child)
+        if depth is None or parent_level < depth:
+            parent.children.append(child)
+
+    stack = [(top, level, iter(scan_usage(top, state)))]
+
+    while stack:
+        if state.stopped:
+            return top
+
+        node, node_level, entries = stack[-1]
+
+        for entry in entries:
+            result = entry_usage(entry, state)
+
+            if result is None:
+                continue
+
+            child, is_dir = result
+
+            if is_dir:
+                stack.append((child, node_level + 1, iter(scan_usage(child, state))))
+                break
+
+            attach(node, child, node_level)
+        else:
+            stack.pop()
+
+            if state.emit is not None:
+                state.emit(DiskUsage(node.path, node.size, node.files))
+
+            if stack:
+                attach(stack[-1][0], node, stack[-1][1])
+
+    return top
+
+
+def subdir_usage(entry, depth, state, level):
+    """
+    Usage of a directory entry, it is a symbolic link (counted as a
+    file), a directory or None if it is in another file system.
+    """
+    try:
+        st = entry.stat(follow_symlinks=False)
+    except OSError:
+        return None
+
+    if entry.is_symlink():
+        return DiskUsage(entry.path, state.usage(st), 1)
+
+    if state.one_filesystem and st.st_dev != state.dev:
+        return None
+
+    return disk_usage(entry.path, depth, state, level)
+
+
+IDU_QUEUE_SIZE = 1024
+
+
+def disk_usage_parallel(root, depth, parallel, state):
+    """
+    Same as disk_usage, but the subdirectories of root
+    are scanned by a pool of parallel threads.
+    """
+    if not parallel:
+        return disk_usage(root, depth, state)
+
+    node = DiskUsage(root, state.usage(os.stat(root, follow_symlinks=False)))
+    result = scan_directory(root)
+
+    if result is None:
+        return node
+
+    _, dirs, files = result
+
+    for entry in files:
+        try:
+            node.size += state.usage(entry.stat(follow_symlinks=False))
+            node.files += 1
+        except OSError:
+            pass
+
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        children = list(executor.map(lambda e: subdir_usage(e, depth, state, 1), dirs))
+
+    for child in children:
+        if child is not None:
+            node.add(child)
+            if depth is None or depth > 0:
+                node.children.append(child)
+
+    if state.emit is not None:
+        state.emit(DiskUsage(node.path, node.size, node.files))
+
+    return node
+
+
+#-------------------------------#
+#           SEARCH              #
+#-------------------------------#
+
+DEFAULT_EXCLUDES = (".git", ".hg", ".svn", "node_modules", "__pycache__")
+
+
+def compile_globs(patterns):
+    """
+    Compile a list of glob patterns into a single regex,
+    returns None if the list is empty.
+    """
+    patterns = list(patterns)
+
+    if not patterns:
+        return None
+
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
+def translate_gitignore(pattern):
+    """
+    Translate a .gitignore pattern (without the ! and the trailing /)
+    to a regex matched against the path relative to the .gitignore
+    directory, with / as separator.
+    """
+    anchored = "/" in pattern
+
+    pattern = pattern.lstrip("/")
+    regex = []
+    i = 0
+
+    while i < len(pattern):
+        c = pattern[i]
+
+        if pattern.startswith("**/", i):
+            regex.append("(?:.*/)?")
+            i += 3
+            continue
+        elif pattern.startswith("**", i):
+            regex.append(".*")
+            i += 2
+            continue
+        elif c == "*":
+            regex.append("[^/]*")
+        elif c == "?":
+            regex.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+
+            if end < 0:
+                regex.append(re.escape(c))
+            else:
+                chars = pattern[i + 1:end]
+                if chars.startswith("!"):
+                    chars = "^" + chars[1:]
+                regex.append("[" + chars + "]")
+                i = end
+        else:
+            regex.append(re.escape(c))
+
+        i += 1
+
+    if anchored:
+        return re.compile("".join(regex) + "$")
+
+    return re.compile("(?:.*/)?" + "".join(regex) + "$")
+
+
+class GitIgnore(object):
+    """
+    Rules of a .gitignore file. The last matching rule wins
+    and rules starting with ! re-include a path.
+    """
+
+    def __init__(self, base, lines):
+        self.base = base
+        self.rules = []
+
+        for line in lines:
+            line = line.rstrip("\n").rstrip()
+
+            if not line or line.startswith("#"):
+                continue
+
+            negate = line.startswith("!")
+
+            if negate:
+                line = line[1:]
+
+            dir_only = line.endswith("/")
+            self.rules.append((translate_gitignore(line.rstrip("/")), negate, dir_only))
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, errors="replace") as fp:
+            return cls(os.path.dirname(filename), fp)
+
+    def match(self, path, is_dir):
+        """
+        Return True if the path is ignored, False if it is
+        re-included and None if no rule matches it.
+        """
+        rel = os.path.relpath(path, self.base).replace(os.sep, "/")
+        result = None
+
+        for regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel):
+                result = not negate
+
+        return result
+
+
+def is_ignored(ignores, path, is_dir):
+    """ Apply the GitIgnore rules from the top directory down """
+    result = False
+
+    for ignore in ignores:
+        match = ignore.match(path, is_dir)
+
+        if match is not None:
+            result = match
+
+    return result
+
+
+def iter_file_stats(top, recursive=False, pattern="*", min_size=None, min_age=None, max_age=None):
+    """
+    Yield (path, stat) of the files under top that match the glob
+    pattern (on the file name) and the size and age filters.
+    """
+    now = time.time()
+
+    if recursive:
+        tree = scandir_walk(top)
+    else:
+        tree = filter(None, [scan_directory(top)])
+
+    for root, dirs, files in tree:
+        for entry in files:
+
+            if pattern != "*" and not fnmatch.fnmatch(entry.name, pattern):
+                continue
+
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+
+            if min_size is not None and st.st_size < min_size:
+                continue
+            if min_age is not None and now - st.st_mtime < min_age:
+                continue
+            if max_age is not None and now - st.st_mtime > max_age:
+                continue
+
+            yield entry.path, st
+
+
+HASH_ENDS_SIZE = 64 * 1024
+
+
+def hash_file_ends(filename, algo="md5"):
+    """
+    Return the hex digest of the first and last HASH_ENDS_SIZE
+    bytes of a file, a cheap test before hashing the whole file.
+    """
+    h = hashlib.new(algo)
+
+    with open(filename, "rb") as fp:
+        h.update(fp.read(HASH_ENDS_SIZE))
+
+        size = os.fstat(fp.fileno()).st_size
+
+        if size > HASH_ENDS_SIZE:
+            fp.seek(max(HASH_ENDS_SIZE, size - HASH_ENDS_SIZE))
+            h.update(fp.read(HASH_ENDS_SIZE))
+
+    return h.hexdigest()
+
+
+def group_by_key(items, keys):
+    """
+    Return the groups with more than one item that have the same key,
+    the items with the key None are left out.
+    """
+    groups = defaultdict(list)
+
+    for item, key in zip(items, keys):
+        if key is not None:
+            groups[key].append(item)
+
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def scan_directory(root):
+    """
+    Scan a single directory and return (root, dirs, files) where dirs
+    and files are lists of os.DirEntry, or None if it can not be read.
+    """
+    dirs = []
+    files = []
+
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    dirs.append(entry)
+                else:
+                    files.append(entry)
+    except OSError:
+        return None
+
+    return root, dirs, files
+
+
+class LinkGuard(object):
+    """
+    Decide if a walk descends into a directory entry. Symbolic links
+    are followed only if followlinks is True, and then the (st_dev,
+    st_ino) of the visited directories are recorded to break cycles.
+    """
+
+    def __init__(self, top, followlinks=False):
+        self.followlinks = followlinks
+        self.visited = set()
+
+        if followlinks:
+            try:
+                st = os.stat(top)
+                self.visited.add((st.st_dev, st.st_ino))
+            except OSError:
+                pass
+
+    def descend(self, entry):
+        if not self.followlinks:
+            return not entry.is_symlink()
+
+        try:
+            st = entry.stat()
+        except OSError:
+            return False
+
+        key = (st.st_dev, st.st_ino)
+
+        if key in self.visited:
+            return False
+
+        self.visited.add(key)
+        return True
+
+
+def scandir_walk(top, followlinks=False):
+    """
+    Equivalent to os.walk(top, followlinks=followlinks) built on
+    os.scandir, but it yields (root, dirs, files) where dirs and
+    files are lists of os.DirEntry, so the file type and stat
+    data of each entry can be reused without extra syscalls.
+    Directories that can not be read are skipped.
+    """
+    stack = [top]
+    visited = LinkGuard(top, followlinks)
+
+    while stack:
+        result = scan_directory(stack.pop())
+
+        if result is None:
+            continue
+
+        yield result
+
+        for entry in reversed(result[1]):
+            if visited.descend(entry):
+                stack.append(entry.path)
+
+
+def parallel_scandir_walk(top, workers, followlinks=False):
+    """
+    Same as scandir_walk, but the directories are scanned by a pool
+    of worker threads. Each scanned directory submits its
+    subdirectories to the shared pool queue, so idle workers pick up
+    pending directories from any branch of the tree.
+
+    The results are yielded as soon as each directory is scanned,
+    so the order is not deterministic.
+    """
+    visited = LinkGuard(top, followlinks)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(scan_directory, top)}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                result = future.result()
+
+                if result is None:
+                    continue
+
+                for entry in result[1]:
+                    if visited.descend(entry):
+                        pending.add(executor.submit(scan_directory, entry.path))
+
+                yield result
+
+
+def walk_tree(top, followlinks=False, parallel=None):
+    """
+    Dispatch to scandir_walk or, if parallel is the number of threads,
+    to parallel_scandir_walk.
+    """
+    if parallel:
+        return parallel_scandir_walk(top, parallel, followlinks)
+    return scandir_walk(top, followlinks)
+
+
+#-------------------------------#
+#          ARCHIVES             #
+#-------------------------------#
+
+ZIP_CACHE_SIZE = 16
+
+_zip_cache = OrderedDict()
+_zip_cache_lock = threading.Lock()
+
+
+def open_zipfile(filename):
+    """
+    Return a cached ZipFile object for filename. The cache keeps the
+    ZIP_CACHE_SIZE most recently used archives and it is invalidated
+    when the file mtime or size change.
+    """
+    filename = os.path.abspath(filename)
+    st = os.stat(filename)
+    key = (st.st_mtime_ns, st.st_size)
+
+    with _zip_cache_lock:
+        cached = _zip_cache.get(filename)
+
+        if cached is not None and cached[0] == key:
+            _zip_cache.move_to_end(filename)
+            return cached[1]
+
+        zf = zipfile.ZipFile(filename)
+        _zip_cache[filename] = (key, zf)
+
+        if cached is not None:
+            cached[1].close()
+
+        while len(_zip_cache) > ZIP_CACHE_SIZE:
+            _, (_, old) = _zip_cache.popitem(last=False)
+            old.close()
+
+        return zf
+
+
+class TarMember(io.BufferedReader):
+    """
+    File object of a tar member that closes the archive when it is closed.
+    """
+
+    def __init__(self, tar, fp):
+        io.BufferedReader.__init__(self, fp)
+        self._tar = tar
+
+    def close(self):
+        try:
+            io.BufferedReader.close(self)
+        finally:
+            self._tar.close()
+
+
+def zip_member_path(path, info):
+    """
+    Return the path where a zip member is extracted, the drive,
+    absolute and ".." parts of its name are removed like
+    ZipFile.extract does so it can't escape from path.
+    """
+    name = info.filename.replace("/", os.sep)
+
+    if os.altsep:
+        name = name.replace(os.altsep, os.sep)
+
+    name = os.path.splitdrive(name)[1]
+    parts = [x for x in name.split(os.sep) if x not in ("", os.curdir, os.pardir)]
+
+    return os.path.join(path, *parts)
+
+
+def extract_zip_parallel(filename, path, workers):
+    """
+    Extract a zip file with a pool of threads, each thread
+    has its own ZipFile object. The directories are created
+    first so the workers don't race creating them.
+    """
+    with zipfile.ZipFile(filename) as zf:
+        infos = zf.infolist()
+
+    for info in infos:
+        target = zip_member_path(path, info)
+        directory = target if info.is_dir() else os.path.dirname(target)
+        os.makedirs(directory, exist_ok=True)
+
+    local = threading.local()
+    archives = []
+
+    def extract(info):
+        zf = getattr(local, "zf", None)
+
+        if zf is None:
+            zf = local.zf = zipfile.ZipFile(filename)
+            archives.append(zf)
+
+        zf.extract(info, path)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(extract, [i for i in infos if not i.is_dir()]))
+    finally:
+        for zf in archives:
+            zf.close()
+
+
+COMPRESSORS = {
+    "gz": lambda level, data: gzip.compress(data, level),
+    "bz2": lambda level, data: bz2.compress(data, level),
+    "xz": lambda level, data: lzma.compress(data, preset=level),
+}
+
+# The xz preset 9 needs about 674 MiB per compressor, 6 needs 94 MiB
+DEFAULT_LEVELS = {"gz": 9, "bz2": 9, "xz": 6, "zip": 9}
+
+
+class ParallelCompressWriter(object):
+    """
+    Write-only file object that splits the data in blocks, compresses
+    them on a thread pool and writes the compressed blocks to fp in
+    order. zlib, bz2 and lzma release the GIL while compressing.
+    """
+
+    def __init__(self, fp, compress, workers, block_size=1024 * 1024):
+        self.fp = fp
+        self.compress = compress
+        self.block_size = block_size
+        self.max_pending = workers * 2
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._pending = deque()
+        self._buffer = bytearray()
+
+    def write(self, data):
+        self._buffer.extend(data)
+
+        while len(self._buffer) >= self.block_size:
+            block = bytes(self._buffer[:self.block_size])
+            del self._buffer[:self.block_size]
+            self._submit(block)
+
+        return len(data)
+
+    def _submit(self, block):
+        self._pending.append(self._executor.submit(self.compress, block))
+
+        while len(self._pending) > self.max_pending:
+            self.fp.write(self._pending.popleft().result())
+
+    def close(self):
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer = bytearray()
+
+        while self._pending:
+            self.fp.write(self._pending.popleft().result())
+
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+#-------------------------------#
+#     DIRECTORY WATCHING        #
+#-------------------------------#
+
+WatchEvent = namedtuple("WatchEvent", "kind path")
+
+
+def coalesce_events(events):
+    """
+    Merge the events of the same path, keeping the order in which
+    the paths were first seen:
+
+        created  + modified  -> created
+        created  + deleted   -> (nothing)
+        deleted  + created   -> modified
+        modified + deleted   -> deleted
+    """
+    state = OrderedDict()
+
+    for kind, path in events:
+        previous = state.get(path)
+
+        if previous is None:
+            state[path] = kind
+        elif previous == "created":
+            if kind == "deleted":
+                state[path] = None
+        elif previous == "deleted":
+            if kind == "created":
+                state[path] = "modified"
+        else:
+            state[path] = kind if kind == "deleted" else previous
+
+    return [WatchEvent(kind, path) for path, kind in state.items() if kind is not None]
+
+
+def take_snapshot(top, recursive=True):
+    """ Return {path: (mtime_ns, size)} of the entries under top """
+    if recursive:
+        tree = scandir_walk(top)
+    else:
+        tree = filter(None, [scan_directory(top)])
+
+    snapshot = {}
+
+    for root, dirs, files in tree:
+        for entry in dirs + files:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+
+    return snapshot
+
+
+def diff_snapshots(old, new):
+    """ Return the events that turn the snapshot old into new """
+    events = [WatchEvent("deleted", p) for p in old if p not in new]
+
+    for path, key in new.items():
+        previous = old.get(path)
+
+        if previous is None:
+            events.append(WatchEvent("created", path))
+        elif previous != key:
+            events.append(WatchEvent("modified", path))
+
+    return events
+
+
+def poll_events(top, recursive=True, interval=1.0):
+    """
+    Infinite generator of lists of events found by comparing
+    a scandir snapshot of the tree every interval seconds.
+    """
+    snapshot = take_snapshot(top, recursive)
+
+    while True:
+        time.sleep(interval)
+        current = take_snapshot(top, recursive)
+        yield diff_snapshots(snapshot, current)
+        snapshot = current
+
+
+def update_snapshot(snapshot, events):
+    """ Apply the events to a snapshot of take_snapshot """
+    for kind, path in events:
+        if kind == "deleted":
+            snapshot.pop(path, None)
+            prefix = path + os.sep
+            for child in [p for p in snapshot if p.startswith(prefix)]:
+                del snapshot[child]
+            continue
+
+        try:
+            st = os.stat(path, follow_symlinks=False)
+        except OSError:
+            snapshot.pop(path, None)
+        else:
+            snapshot[path] = (st.st_mtime_ns, st.st_size)
+
+
+def inotify_events(inotify, top, recursive=True, interval=1.0, debounce=0.2, deadline=None):
+    """
+    Infinite generator of lists of events read from an inotify
+    instance. After the first event arrives, the events are collected
+    until there are no new ones for debounce seconds, for at most
+    interval seconds, so a file written all the time doesn't hold the
+    batch back. No read waits beyond the deadline (a time.time() value).
+
+    If the kernel event queue overflows (IN_Q_OVERFLOW) the lost events
+    are recovered by scanning the tree again and comparing it with a
+    snapshot that is kept up to date with the events.
+    """
+    from . import linux
+
+    def add_tree(root):
+        tree = scandir_walk(root) if recursive else [(root, [], [])]
+        for directory, dirs, files in tree:
+            inotify.add_watch(directory)
+            yield directory, dirs, files
+
+    def time_left(seconds):
+        if deadline is None:
+            return seconds
+        return max(0, min(seconds, deadline - time.time()))
+
+    list(add_tree(top))
+    snapshot = take_snapshot(top, recursive)
+
+    while True:
+        raw = inotify.read_events(time_left(interval))
+        batch = list(raw)
+        end = time.time() + time_left(interval)
+
+        while raw and time.time() < end:
+            raw = inotify.read_events(min(debounce, end - time.time()))
+            batch.extend(raw)
+
+        events = []
+        overflow = False
+
+        for wd, mask, cookie, name in batch:
+
+            if mask & linux.IN_Q_OVERFLOW:
+                overflow = True
+                continue
+
+            directory = inotify.watches.get(wd)
+
+            if directory is None or not name:
+                continue
+
+            path = os.path.join(directory, name)
+
+            if mask & (linux.IN_CREATE | linux.IN_MOVED_TO):
+                events.append(WatchEvent("created", path))
+
+                if recursive and mask & linux.IN_ISDIR:
+                    # Files may be created before the watch is added
+                    for root, dirs, files in add_tree(path):
+                        events.extend(WatchEvent("created", e.path) for e in dirs + files)
+
+            elif mask & (linux.IN_DELETE | linux.IN_MOVED_FROM):
+                events.append(WatchEvent("deleted", path))
+            elif mask & (linux.IN_MODIFY | linux.IN_CLOSE_WRITE | linux.IN_ATTRIB):
+                events.append(WatchEvent("modified", path))
+
+        if overflow:
+            # Watch the directories created while the events were lost
+            list(add_tree(top))
+            current = take_snapshot(top, recursive)
+            events.extend(diff_snapshots(snapshot, current))
+            snapshot = current
+        else:
+            update_snapshot(snapshot, events)
+
+        yield events
+
+
 class Path(object):
     """
     Python path DSL that adds syntax sugar features 
     for path manipulation.
+
+    Path objects use __slots__ and cache the derived components
+    (dir, name, ext, abs and top) the first time they are accessed.
+    They can be used as dictionary keys and passed to any function
+    that accepts os.PathLike objects.
     """
 
+    __slots__ = ("_path", "_dir", "_name", "_ext", "_abs", "__weakref__")
+
+    # If True the dir property returns interned Path objects,
+    # so the paths of the same directory share a single object.
+    intern_dirs = False
+
+    _intern_table = weakref.WeakValueDictionary()
+
     def __init__(self, path=""):
+        if isinstance(path, Path):
+            path = path._path
         self.path = path
 
+    @property
+    def path(self):
+        return self._path
+
+    @path.setter
+    def path(self, value):
+        self._path = value
+        self._dir = self._name = self._ext = self._abs = None
+
+    @classmethod
+    def intern(cls, path):
+        """
+        Return a shared Path object for the path string. The objects
+        are kept in a weak table while they are referenced.
+        """
+        path = sys.intern(str(path))
+        obj = cls._intern_table.get(path)
+
+        if obj is None:
+            obj = Path(path)
+            cls._intern_table[path] = obj
+
+        return obj
+
     @classmethod
     def here(cls):
         """
@@ -87,28 +1214,43 @@ class Path(object):
     @property
     def dir(self):
         """ Return Path directory """
-        return Path(os.path.dirname(self.path))
+        if self._dir is None:
+            dirname = os.path.dirname(self._path)
+            self._dir = Path.intern(dirname) if Path.intern_dirs else Path(dirname)
+        return self._dir
 
     @property
     def name(self):
-
-        return os.path.basename(self.path)
+        if self._name is None:
+            self._name = os.path.basename(self._path)
+        return self._name
 
     @property
     def top(self):
-        return Path(os.path.abspath(os.path.join(self.path, '..')))
+        return self.abs.dir
 
     @property
     def ext(self):
         """Return file extension """
-        return os.path.splitext(self.path)[1]
+        if self._ext is None:
+            self._ext = os.path.splitext(self._path)[1]
+        return self._ext
 
     @property
     def abs(self):
         """
         Returns the absolute path of object as a Path object
         """
-        return Path(os.path.abspath(self.path))
+        if self._abs is not None:
+            return self._abs
+
+        absolute = Path(os.path.abspath(self._path))
+
+        # Relative paths depend on the current directory
+        if os.path.isabs(self._path):
+            self._abs = absolute
+
+        return absolute
 
 
     @property
@@ -218,10 +1360,32 @@ class Path(object):
             print("\n\nSize: {} Megabytes".format(self.size() / 1024))
 
     def __str__(self):
-        return self.path
+        return self._path
 
     def __repr__(self):
-        return self.path
+        return self._path
+
+    def __fspath__(self):
+        return self._path
+
+    def __eq__(self, other):
+        if isinstance(other, Path):
+            return self._path == other._path
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, Path):
+            return self._path != other._path
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._path)
+
+    def __getstate__(self):
+        return self._path
+
+    def __setstate__(self, state):
+        self.path = state
 
     def list(self, abs=False):
         """
@@ -243,10 +1407,7 @@ class Path(object):
         file like *.zip or *.tar.gz, *.tar, *.tar.bz2
         """
         if self.is_zip():
-            zf = zipfile.ZipFile(self.path, 'r')
-            files = zf.namelist()
-            zf.close()
-            return files
+            return open_zipfile(self.path).namelist()
 
         if self.is_tar():
             tar = tarfile.open(self.path)
@@ -254,68 +1415,207 @@ class Path(object):
             tar.close()
             return files
 
+    def open_member(self, name):
+        """
+        Open a member of a zip or tar archive as a binary file object
+        that is read on demand, without extracting the archive.
+
+        The ZipFile objects and their central directory are cached,
+        so repeated lookups in the same zip file don't parse it again.
+        Tar files have no index, so the headers are read one by one
+        and the scan stops at the first member with that name.
+
+        Example:
+
+        >>> with Path("bundle.zip").open_member("docs/index.html") as fp:
+        ...     header = fp.read(1024)
+        """
+        if self.is_zip():
+            return open_zipfile(self.path).open(name)
+
+        if self.is_tar():
+            tar = tarfile.open(self.path)
+            member = tar.next()
+
+            while member is not None and member.name != name.rstrip("/"):
+                member = tar.next()
+
+            if member is None:
+                tar.close()
+                raise KeyError("filename {!r} not found".format(name))
+
+            fp = tar.extractfile(member)
+
+            if fp is None:
+                tar.close()
+                raise IsADirectoryError(name)
+
+            return TarMember(tar, fp)
+
+        raise ValueError("Not a zip or tar archive: " + self.path)
+
+    def iter_archive(self):
+        """
+        Iterate over the files of a zip or tar archive in a single pass,
+        yielding (name, size, stream). Tar files are read sequentially,
+        so each stream is only valid until the next item. They are opened
+        with mode "r:*" instead of the stream mode "r|*", which can't read
+        the multi-member files written by mktgz(workers=N).
+
+        Example:
+
+        >>> for name, size, fp in Path("logs.tar.gz").iter_archive():
+        ...     if name.endswith(".log"):
+        ...         errors = fp.read().count(b"ERROR")
+        """
+        if self.is_zip():
+            zf = open_zipfile(self.path)
+
+            for info in zf.infolist():
+                if not info.is_dir():
+                    with zf.open(info) as fp:
+                        yield info.filename, info.file_size, fp
+            return
+
+        with tarfile.open(self.path, "r:*") as tar:
+            for member in tar:
+                if member.isfile():
+                    yield member.name, member.size, tar.extractfile(member)
+
+
+    def iterdir(self):
+        """
+        Iterate over the entries of the directory without building a list.
+
+        :return: Iterator of os.DirEntry objects, they have the attributes
+                 name and path and the methods is_dir(), is_file() and
+                 stat() that reuse the data returned by the directory scan.
+        """
+        with os.scandir(self.path) as it:
+            for entry in it:
+                yield entry
+
+    def iwalk(self, pattern="*", followlinks=False, parallel=None):
+        """
+        Iterator version of walk(), yields the path of the files
+        in all subdirectories as soon as they are found.
+
+        :param parallel: Number of threads used to scan the directories.
+                         In parallel mode the order of the files is not
+                         deterministic.
+        """
+        for root, dirs, files in walk_tree(self.path, followlinks, parallel):
+            for entry in files:
+                if fnmatch.fnmatch(entry.path, pattern):
+                    yield entry.path
 
-    def walk(self, pattern="*"):
+    def walk(self, pattern="*", parallel=None):
         """
         Return list of all subdirectories and 
         all files in subdirectories
-        """
 
-        filelist = []
-        # dirlist  = []
+        :param pattern:  Glob pattern matched against the file paths
+        :param parallel: Number of threads used to scan the tree, the
+                         result is sorted to be deterministic.
 
-        for root, dirs, files in os.walk(self.path):
-            files_ = list(map(lambda x: os.path.join(root, x), files))
-            list(map(filelist.append, files_))
-            #dirs_ = list(map(lambda x: os.path.join(root, x), dirs))            
-            #list(map(dirlist.append, dirs_))
+        Example:
+
+        >>> Path("/data/artifacts").walk("*.tar.gz", parallel=16)
+        """
+        if parallel:
+            return sorted(self.iwalk(pattern, parallel=parallel))
 
-        return fnmatch.filter(filelist, pattern)
+        return list(self.iwalk(pattern))
 
     def walk_dirs(self, pattern="*"):
         """ Return all subdirectories of a directory"""
 
         dirlist = []
 
-        for root, dirs, files in os.walk(self.path):
-            dirs_ = mapl(lambda x: os.path.join(root, x), dirs)
-            mapl(dirlist.append, dirs_)
+        for root, dirs, files in scandir_walk(self.path):
+            dirlist.extend(entry.path for entry in dirs)
 
         return fnmatch.filter(dirlist, pattern)
 
 
     def list_dirs(self, abs=False):
-        dirs = filterl(os.path.isdir, self.list(True))
+        dirs = [entry for entry in self.iterdir() if entry.is_dir()]
 
         if not abs:
-            return mapl(os.path.basename, dirs)
+            return [entry.name for entry in dirs]
         else:
-            return dirs
+            return [entry.path for entry in dirs]
 
     def list_files(self, abs=False):
-        files = list(filter(os.path.isfile, self.list(True)))
+        files = [entry for entry in self.iterdir() if entry.is_file()]
 
         if not abs:
-            return list(map(os.path.basename, files))
+            return [entry.name for entry in files]
         else:
-            return files
+            return [entry.path for entry in files]
 
 
-    def newest(self):
+    def _top_files(self, k, key, largest, recursive, pattern, min_size, min_age, max_age):
+        if self.is_dir():
+            directory = self
+        else:
+            directory = self.dir
+
+        entries = iter_file_stats(directory.path, recursive, pattern, min_size, min_age, max_age)
+        select = heapq.nlargest if largest else heapq.nsmallest
+        top = select(1 if k is None else k, entries, key=lambda e: key(e[1]))
+        paths = [Path(path) for path, st in top]
+
+        if k is None:
+            return paths[0] if paths else None
+
+        return paths
+
+    def newest(self, k=None, recursive=False, pattern="*", min_size=None, min_age=None, max_age=None):
         """
         Returns the newest file in the directory.
+
+        :param k:         If given returns a list of the k newest files
+        :param recursive: Search in the subdirectories too
+        :param pattern:   Glob pattern matched against the file name
+        :param min_size:  Ignore files smaller than min_size bytes
+        :param min_age:   Ignore files modified less than min_age seconds ago
+        :param max_age:   Ignore files modified more than max_age seconds ago
+        :return:          Path, None if there is no file, or list of Path
+
+        The files are selected with a heap of size k while the tree is
+        scanned, using the stat data of os.scandir. Broken symbolic links
+        and files that can not be accessed are skipped.
         """
-        if self.is_dir():
-            return Path(max(self.list(True), key=lambda x: os.stat(x).st_mtime))
-        else:
-            return Path(max(self.dir.list(True), key=lambda x: os.stat(x).st_mtime))
+        return self._top_files(k, lambda st: st.st_mtime, True, recursive,
+                               pattern, min_size, min_age, max_age)
+
+    def oldest(self, k=None, recursive=False, pattern="*", min_size=None, min_age=None, max_age=None):
+        """
+        Returns the oldest file in the directory, see Path.newest
+
+        Example:
+
+        >>> Path("/var/tmp/cache").oldest(100, recursive=True, min_age=7 * 86400)
+        """
+        return self._top_files(k, lambda st: st.st_mtime, False, recursive,
+                               pattern, min_size, min_age, max_age)
+
+    def largest(self, k=None, recursive=False, pattern="*", min_size=None, min_age=None, max_age=None):
+        """
+        Returns the largest file in the directory, see Path.newest
+        """
+        return self._top_files(k, lambda st: st.st_size, True, recursive,
+                               pattern, min_size, min_age, max_age)
 
     def __truediv__(self, other):
 
-        if isinstance(other, Path):
-            return Path(os.path.join(self.path, other.path))
+        if type(other) is str:
+            return Path(os.path.join(self._path, other))
+        elif isinstance(other, Path):
+            return Path(os.path.join(self._path, other._path))
         elif isinstance(other, str):
-            return Path(os.path.join(self.path, other))
+            return Path(os.path.join(self._path, other))
         else:
             raise Exception("Expected type: str or Path object")
 
@@ -370,30 +1670,74 @@ class Path(object):
 
     def read(self, filename=None):
 
+        if filename is not None and self.is_file() and (self.is_zip() or self.is_tar()):
+
+            with self.open_member(filename) as fp:
+                return fp.read()
+
         if self.is_file():
             return open(self.path).read()
 
-        if filename is not None:
+        if filename is not None and self.is_dir():
 
-            if self.is_zip():
+            p = self / filename
+            return p.read()
 
-                import zipfile
+    def mmap(self, mode="r"):
+        """
+        Map the file in memory without copying it.
 
-                zf = zipfile.ZipFile(self.path)
-                content = zf.read(filename)
-                zf.close()
-                return content
+        :param mode: "r" read only, "w" (or "r+") writes go to the file,
+                     "c" copy on write, writes are not saved.
+        :return:     mmap.mmap object, it can be used as a context
+                     manager, sliced like bytes or wrapped in a memoryview.
 
-            elif self.is_dir():
+        Example:
+
+        >>> with Path("data.bin").mmap() as mm:
+        ...     header = mm[:16]
+        ...     pos = mm.find(b"ERROR")
+        """
+        return map_file(self.path, mode)
+
+    def iter_lines(self, mmap=True, encoding=None):
+        """
+        Iterate over the lines of the file without the line terminator
+        and without reading the whole file in memory.
+
+        :param mmap:     Find the line boundaries in a memory map of the
+                         file instead of reading it with a buffer.
+        :param encoding: If given the lines are decoded, otherwise they
+                         are returned as bytes.
+        """
+        if mmap:
+            lines = iter_mmap_lines(self.path)
+        else:
+            lines = iter_file_lines(self.path)
+
+        if encoding is None:
+            return lines
 
-                p = self / filename
-                return p.read()
+        return (line.decode(encoding) for line in lines)
 
-    def extract(self, path):
+    def extract(self, path, workers=None):
+        """
+        Extract a zip or tar archive to the directory path.
+
+        :param workers: Number of threads used to extract the members
+                        of a zip file. Zip members are compressed
+                        independently, so they can be decompressed in
+                        parallel. Tar files are always extracted
+                        sequentially.
+        :return:        Path(path)
+        """
         if self.is_zip():
-            zf = zipfile.ZipFile(self.path)
-            zf.extractall(path=path)
-            zf.close()
+            if workers and workers > 1:
+                extract_zip_parallel(self.path, path, workers)
+            else:
+                zf = zipfile.ZipFile(self.path)
+                zf.extractall(path=path)
+                zf.close()
 
         if self.is_tar():
             tar = tarfile.open(self.path)
@@ -420,36 +1764,357 @@ class Path(object):
         """
         src = self.path
 
+        if not self.is_dir():
+            shutil.copy(src, dest)
+            return Path(dest)
+
         try:
             shutil.copytree(src, dest)
         except OSError as e:
-            # If the error was caused because the source wasn't a directory
-            if e.errno == errno.ENOTDIR:
-                shutil.copy(src, dest)
-            else:
-                print('Directory not copied. Error: %s' % e)
+            print('Directory not copied. Error: %s' % e)
 
         return Path(dest)
 
+    @classmethod
+    def copy_many(cls, pairs, workers=8):
+        """
+        Copy many files or directories on a thread pool.
+
+        :param pairs:   List of (source, destination). If the destination
+                        is an existing directory, or ends with a path
+                        separator, the source is copied into it. The
+                        missing parent directories (and the directory
+                        ending with a separator) are created.
+        :param workers: Number of threads
+        :return:        List of OpResult(path, dest, ok, error), in the
+                        same order as pairs.
+
+        The file data is copied by the kernel with os.copy_file_range or
+        os.sendfile when they are available.
+
+        Example:
+
+        >>> report = Path.copy_many([("build/app", "/srv/app"), ("app.conf", "/etc/app/")])
+        >>> [r for r in report if not r.ok]
+        []
+        """
+        pairs = [(str(src), str(dest)) for src, dest in pairs]
+        make_dirs(dest_directory(dest) for src, dest in pairs)
+        return run_bulk(copy_path, pairs, workers)
+
+    @classmethod
+    def remove_many(cls, paths, workers=8):
+        """
+        Remove many files or directory trees on a thread pool.
+
+        :return: List of OpResult(path, None, ok, error)
+        """
+        return run_bulk(remove_path, [(str(p), None) for p in paths], workers)
+
+    @classmethod
+    def mkdirs(cls, paths):
+        """
+        Create many directories and their parents. The paths are created
+        by depth, so the parents are always created before the children.
+
+        :return: List of OpResult(path, None, ok, error)
+        """
+        paths = [str(p) for p in paths]
+        errors = make_dirs(paths)
+        return [OpResult(p, None, p not in errors, errors.get(p)) for p in paths]
+
+    @classmethod
+    def symlink_many(cls, pairs, workers=8):
+        """
+        Create many symbolic links. pairs is a list of (target, link name).
+
+        :return: List of OpResult(path, dest, ok, error)
+        """
+        return run_bulk(os.symlink, [(str(src), str(dest)) for src, dest in pairs], workers)
+
     def size(self):
         return os.path.getsize(self.path)
 
+    def du(self, depth=1, parallel=None, one_filesystem=False, apparent=False):
+        """
+        Disk usage of the directory tree, like the du command.
+
+        :param depth:          Depth of the returned tree, the sizes always
+                               include the whole tree. None for unlimited.
+        :param parallel:       Number of threads, the subdirectories of the
+                               top directory are scanned in parallel.
+        :param one_filesystem: Don't descend in other file systems (du -x)
+        :param apparent:       Use the file sizes instead of the allocated
+                               blocks (du --apparent-size)
+        :return:               DiskUsage tree with the attributes path,
+                               size (bytes), files and children.
+
+        Hard links are counted only once.
+
+        Example:
+
+        >>> usage = Path("/home").du(depth=1, parallel=8)
+        >>> for child in sorted(usage.children, key=lambda c: -c.size):
+        ...     print(child.path, child.size // 2**30, "GB", child.files, "files")
+        """
+        state = DiskUsageState(self.path, one_filesystem, apparent)
+        return disk_usage_parallel(self.path, depth, parallel, state)
+
+    def idu(self, parallel=None, one_filesystem=False, apparent=False):
+        """
+        Stream the disk usage of each directory as soon as its subtree
+        is scanned. Yields DiskUsage objects (without children), the
+        top directory is the last one.
+
+        The scan runs ahead of the consumer by at most IDU_QUEUE_SIZE
+        directories and is stopped when the iterator is closed.
+        """
+        results = queue.Queue(maxsize=IDU_QUEUE_SIZE)
+        done = object()
+
+        def put(node):
+            # Wait for room in the queue unless the consumer is gone
+            while not state.stopped:
+                try:
+                    results.put(node, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        state = DiskUsageState(self.path, one_filesystem, apparent, put)
+
+        def run():
+            try:
+                disk_usage_parallel(self.path, 0, parallel, state)
+            finally:
+                put(done)
+
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+
+        try:
+            while True:
+                node = results.get()
+                if node is done:
+                    break
+                yield node
+        finally:
+            # The scan stops if the iteration is abandoned
+            state.stopped = True
+            worker.join()
+
 
     def get(self, filename):
         return Path(os.path.join(self.path, filename))
 
-    def mktgz(self, output_filename):
-        """Compress directory to .tgz"""
+    def mktgz(self, output_filename, workers=None, level=None, format="gz"):
+        """
+        Compress directory to .tgz
+
+        :param output_filename: Archive file name
+        :param workers:         Number of threads used to compress. The tar
+                                stream is split in blocks compressed in
+                                parallel and written as a multi-member
+                                gzip/bz2/xz file (like pigz). It is read by
+                                the gzip, bz2 and xz tools and by tarfile
+                                in the "r:*" mode, but not by the tarfile
+                                stream mode "r|*".
+        :param level:           Compression level (preset for xz). The
+                                default is 9, or 6 for xz since each xz
+                                worker needs about 674 MiB with the preset 9.
+        :param format:          "gz", "bz2", "xz" or "zip"
+
+        Example:
+
+        >>> Path("build/dist").mktgz("dist.tar.gz", workers=8, level=6)
+        """
 
         if not self.is_dir():
             raise Exception("Path must be a directory")
 
-        with tarfile.open(output_filename, "w:gz") as tar:
-            tar.add(self.path, arcname=os.path.basename(self.path))
+        arcname = os.path.basename(self.path)
+
+        if level is None:
+            level = DEFAULT_LEVELS.get(format, 9)
+
+        if format == "zip":
+            with zipfile.ZipFile(output_filename, "w", zipfile.ZIP_DEFLATED, compresslevel=level) as zf:
+                for filename in self.iwalk():
+                    zf.write(filename, os.path.join(arcname, os.path.relpath(filename, self.path)))
+            return
+
+        if format not in COMPRESSORS:
+            raise ValueError("Unknown format: " + format)
+
+        if not workers or workers < 2:
+            if format == "xz":
+                tar = tarfile.open(output_filename, "w:xz", preset=level)
+            else:
+                tar = tarfile.open(output_filename, "w:" + format, compresslevel=level)
+
+            with tar:
+                tar.add(self.path, arcname=arcname)
+            return
+
+        compress = partial(COMPRESSORS[format], level)
+
+        with open(output_filename, "wb") as fp:
+            with ParallelCompressWriter(fp, compress, workers) as writer:
+                with tarfile.open(fileobj=writer, mode="w|") as tar:
+                    tar.add(self.path, arcname=arcname)
 
     def md5(self):
+        """
+        Return the md5 of the path string, not of the file content.
+        Use Path.hash() to hash the file content.
+        """
         return hashlib.md5(self.path.encode('utf-8')).hexdigest()
 
+    def hash(self, algo="md5", chunk_size=HASH_CHUNK_SIZE, use_mmap=None, cache=None):
+        """
+        Return the hex digest of the file content.
+
+        :param algo:       Hash algorithm: md5, sha1, sha256, blake2b or
+                           any other name accepted by hashlib.new
+        :param chunk_size: Size of the blocks read from the file
+        :param use_mmap:   Map the file in memory instead of reading it in
+                           chunks. By default files larger than
+                           MMAP_THRESHOLD are mapped.
+        :param cache:      Optional utils3.statcache.StatCache, the file
+                           is read only if it changed since it was cached.
+        :return:           Hex digest string
+
+        Example:
+
+        >>> Path("/boot/vmlinuz").hash("sha256")
+        """
+        if cache is not None:
+            return cache.hash(self.path, algo)
+
+        return hash_file(self.path, algo, chunk_size, use_mmap)
+
+    def hash_tree(self, algo="md5", pattern="*", parallel=None, cache=None):
+        """
+        Hash the content of all files in the directory tree.
+
+        :param algo:     Hash algorithm, see Path.hash
+        :param pattern:  Glob pattern matched against the file paths
+        :param parallel: Number of threads used to hash the files
+        :param cache:    Optional utils3.statcache.StatCache
+        :return:         Dictionary {relative path: hex digest}
+        """
+        files = self.walk(pattern)
+
+        if cache is not None:
+            digest = lambda f: cache.hash(f, algo)
+        else:
+            digest = lambda f: hash_file(f, algo)
+
+        if parallel:
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                digests = list(executor.map(digest, files))
+        else:
+            digests = mapl(digest, files)
+
+        if cache is not None:
+            cache.flush()
+
+        return dict(zip([os.path.relpath(f, self.path) for f in files], digests))
+
+    def find_duplicates(self, min_size=1, pattern="*", algo="sha256", parallel=8, cache=None):
+        """
+        Find files with the same content in the directory tree.
+
+        The files are first grouped by size, then by a hash of their
+        first and last 64 KiB, and only the files that still collide
+        are fully hashed, in parallel. Hard links to the same inode
+        are not reported as duplicates.
+
+        :param min_size: Ignore files smaller than min_size bytes
+        :param pattern:  Glob pattern matched against the file names
+        :param algo:     Hash algorithm, see Path.hash
+        :param parallel: Number of threads used to hash the files
+        :param cache:    Optional utils3.statcache.StatCache for the full hashes
+        :return:         Container with the attributes:
+                           groups      - list of lists of duplicated files
+                           reclaimable - bytes freed by keeping one file per group
+                           skipped     - files that could not be read
+
+        Example:
+
+        >>> dups = Path("/data/photos").find_duplicates()
+        >>> dups.reclaimable // 2**20
+        2304
+        """
+        by_size = defaultdict(list)
+        inodes = set()
+
+        for path, st in iter_file_stats(self.path, True, pattern, min_size):
+            if (st.st_dev, st.st_ino) not in inodes:
+                inodes.add((st.st_dev, st.st_ino))
+                by_size[st.st_size].append(path)
+
+        candidates = [(size, paths) for size, paths in by_size.items() if len(paths) > 1]
+        groups = []
+        skipped = []
+
+        def try_hash(function, filename):
+            try:
+                return function(filename, algo)
+            except OSError:
+                skipped.append(filename)
+                return None
+
+        if cache is not None:
+            full_hash = cache.hash
+        else:
+            full_hash = hash_file
+
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+
+            for size, paths in candidates:
+                partial_hashes = executor.map(partial(try_hash, hash_file_ends), paths)
+
+                for same_ends in group_by_key(paths, partial_hashes):
+
+                    if size <= 2 * HASH_ENDS_SIZE:
+                        # The first and last blocks cover the whole file
+                        groups.append((size, same_ends))
+                        continue
+
+                    digests = executor.map(partial(try_hash, full_hash), same_ends)
+
+                    for same_content in group_by_key(same_ends, digests):
+                        groups.append((size, same_content))
+
+        if cache is not None:
+            cache.flush()
+
+        return Container(groups=[sorted(paths) for size, paths in groups],
+                         reclaimable=sum(size * (len(paths) - 1) for size, paths in groups),
+                         skipped=sorted(skipped))
+
+    def verify_tree(self, manifest, algo="md5", parallel=None, cache=None):
+        """
+        Check the directory tree against a manifest created by hash_tree.
+
+        :param manifest: Dictionary {relative path: hex digest}
+        :return:         Dictionary {relative path: (expected, actual)} of
+                         files that differ, actual is None for missing
+                         files and expected is None for new files.
+        """
+        digests = self.hash_tree(algo, parallel=parallel, cache=cache)
+        diff = {}
+
+        for name in set(manifest) | set(digests):
+            expected = manifest.get(name)
+            actual = digests.get(name)
+
+            if expected != actual:
+                diff[name] = (expected, actual)
+
+        return diff
+
 
     def link(self, dest):
         """
@@ -528,14 +2193,16 @@ class Path(object):
         return p
 
 
-    def scan(self, formats=""):
+    def scan(self, formats="", parallel=None):
         """
         Scan directory and return the absolute path of each file
         found that matches a given pattern
 
 
-        :param formats: List of patterns, eg.:  [ ".txt", "*.flv" ]
-        :return:        List of files found with the given pattern.
+        :param formats:  List of patterns, eg.:  [ ".txt", "*.flv" ]
+        :param parallel: Number of threads used to scan the tree, the
+                         result is sorted to be deterministic.
+        :return:         List of files found with the given pattern.
 
 
         Example:
@@ -554,16 +2221,166 @@ class Path(object):
         ...
         """
 
-        # import fnmatch
-        # import os
-
-        #formats = ['*.ogg', '*.mp4', '*.wmv', '*.flv']
         matches = []
+        regex = compile_globs(formats)
 
-        for root, dirnames, filenames in os.walk(self.path, followlinks=True):
-            for extensions in formats:
-                for filename in fnmatch.filter(filenames, extensions):
-                    matches.append(os.path.join(root, filename))
+        if regex is None:
+            return matches
+
+        for root, dirs, files in walk_tree(self.path, True, parallel):
+            matches.extend(entry.path for entry in files if regex.match(entry.name))
+
+        if parallel:
+            matches.sort()
 
         return matches
 
+    def search(self, patterns="*", exclude=DEFAULT_EXCLUDES, gitignore=False,
+               max_depth=None, predicate=None, followlinks=False):
+        """
+        Search the directory tree and yield the paths of the
+        matching files as they are found.
+
+        :param patterns:    Glob pattern or list of patterns matched
+                            against the file names, e.g. ["*.py", "*.pyx"]
+        :param exclude:     Glob patterns of directory names that are not
+                            entered, by default VCS and cache directories.
+        :param gitignore:   Read the .gitignore files of the tree and skip
+                            the files and directories they ignore.
+        :param max_depth:   Maximum depth, 0 searches only this directory.
+        :param predicate:   Function predicate(path, stat) to filter the
+                            files, e.g. by size or mtime.
+        :param followlinks: Enter symbolic links to directories, cycles
+                            are detected by (st_dev, st_ino).
+        :return:            Iterator of file paths
+
+        Example:
+
+        >>> big = lambda path, st: st.st_size > 10 * 2**20
+        >>> list(Path("~/src").search(["*.log", "*.tmp"], gitignore=True, predicate=big))
+        """
+        if is_string(patterns):
+            patterns = [patterns]
+
+        regex = compile_globs(patterns)
+        excluded = compile_globs(exclude or [])
+        visited = LinkGuard(self.path, followlinks)
+        stack = [(self.path, 0, ())]
+
+        while stack:
+            root, depth, ignores = stack.pop()
+
+            if gitignore:
+                ignore_file = os.path.join(root, ".gitignore")
+
+                if os.path.isfile(ignore_file):
+                    ignores = ignores + (GitIgnore.load(ignore_file),)
+
+            result = scan_directory(root)
+
+            if result is None:
+                continue
+
+            _, dirs, files = result
+
+            for entry in files:
+
+                if regex is not None and not regex.match(entry.name):
+                    continue
+
+                if ignores and is_ignored(ignores, entry.path, False):
+                    continue
+
+                if predicate is not None:
+                    try:
+                        if not predicate(entry.path, entry.stat()):
+                            continue
+                    except OSError:
+                        continue
+
+                yield entry.path
+
+            if max_depth is not None and depth >= max_depth:
+                continue
+
+            for entry in reversed(dirs):
+
+                if excluded is not None and excluded.match(entry.name):
+                    continue
+
+                if ignores and is_ignored(ignores, entry.path, True):
+                    continue
+
+                if visited.descend(entry):
+                    stack.append((entry.path, depth + 1, ignores))
+
+    def watch(self, callback=None, recursive=True, interval=1.0, debounce=0.2,
+              timeout=None, poll=False):
+        """
+        Watch the directory for changes.
+
+        On Linux the changes are read from inotify, otherwise (or if
+        poll is True or inotify is not available) the tree is scanned
+        every interval seconds and compared with the previous scan.
+        The events of the same path are coalesced.
+
+        :param callback:  If given, it is called with each event and
+                          watch() blocks until the timeout.
+        :param recursive: Watch the subdirectories too.
+        :param interval:  Poll interval in seconds.
+        :param debounce:  Wait for debounce seconds without new events
+                          before emitting a batch, but no more than
+                          interval seconds (inotify only).
+        :param timeout:   Stop after timeout seconds (None: forever).
+        :return:          Iterator of WatchEvent(kind, path) where kind
+                          is "created", "modified" or "deleted".
+
+        Example:
+
+        >>> for event in Path("/var/spool/jobs").watch():
+        ...     print(event.kind, event.path)
+
+        >>> Path("/etc").watch(print, timeout=60)
+        """
+        events = self._watch_events(recursive, interval, debounce, timeout, poll)
+
+        if callback is None:
+            return events
+
+        for event in events:
+            callback(event)
+
+    def _watch_events(self, recursive, interval, debounce, timeout, poll):
+        inotify = None
+        deadline = None if timeout is None else time.time() + timeout
+
+        if not poll and is_linux():
+            try:
+                from .linux import Inotify
+                inotify = Inotify()
+                batches = inotify_events(inotify, self.path, recursive, interval, debounce, deadline)
+                # Add the watches here, so if it fails we fall back to polling
+                first = next(batches)
+            except (OSError, AttributeError, ImportError):
+                if inotify is not None:
+                    inotify.close()
+                inotify = None
+
+        if inotify is None:
+            batches = poll_events(self.path, recursive, interval)
+            first = []
+
+        try:
+            batch = first
+
+            while True:
+                for event in coalesce_events(batch):
+                    yield event
+
+                if deadline is not None and time.time() >= deadline:
+                    return
+
+                batch = next(batches)
+        finally:
+            if inotify is not None:
+                inotify.close()
@@ -19,7 +19,7 @@ import os
 from .Path import Path
 from .Enum import Enum
 from .Container import Container
-from .Chain import Chain
+from .Chain import Chain, LazyChain, NumericChain
 
 from .check import is_python2, is_python27, is_python3
 
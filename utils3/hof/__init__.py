@@ -0,0 +1,2856 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Higher Order Functions
+"""
+
+import itertools
+import operator
+import collections
+import functools
+import inspect
+import random
+import threading
+import time
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+# Non Standard Library Module
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+LITERAL_TYPES = (int, str, bytes, bool, type(None))
+
+
+def is_array(x):
+    return numpy is not None and isinstance(x, numpy.ndarray)
+
+
+def logical_and(x, y):
+    if is_array(x) or is_array(y):
+        return numpy.logical_and(x, y)
+    return x and y
+
+
+def logical_or(x, y):
+    if is_array(x) or is_array(y):
+        return numpy.logical_or(x, y)
+    return x or y
+
+
+def array_sum(x):
+    if is_array(x):
+        return x.sum()
+    return sum(x)
+
+
+def array_map(function, x):
+    if is_array(x) and isinstance(function, Operator):
+        return function(x)
+    return list(map(native(function), x))
+
+
+EXPRESSION_GLOBALS = {
+    "_and": logical_and,
+    "_or": logical_or,
+    "_sum": array_sum,
+    "_map": array_map,
+}
+
+
+shared_ids = itertools.count()
+
+
+def lift(value):
+    """ Return the expression tree node of value """
+    if isinstance(value, Operator):
+        return value._node
+    return ("const", value)
+
+
+def substitute(node, arg):
+    """ Replace the argument of a one argument expression tree by arg """
+    kind = node[0]
+
+    if kind in ("arg", "shared"):
+        return arg
+
+    if kind == "const":
+        return node
+
+    if kind == "call":
+        return (kind, substitute(node[1], arg), node[2],
+                tuple(substitute(n, arg) for n in node[3]),
+                tuple((k, substitute(n, arg)) for k, n in node[4]))
+
+    if kind == "apply":
+        return (kind, node[1], tuple(substitute(n, arg) for n in node[2]))
+
+    return (kind,) + tuple(substitute(n, arg) if isinstance(n, tuple) else n
+                           for n in node[1:])
+
+
+def renumber(node, ids):
+    """
+    Give new ids to the shared argument markers of an expression tree,
+    so an unpickled expression doesn't share markers with the
+    expressions of this process.
+    """
+    if not isinstance(node, tuple) or node[:1] == ("const",):
+        return node
+
+    if len(node) == 2 and node[0] == "shared" and isinstance(node[1], int):
+        if node not in ids:
+            ids[node] = ("shared", next(shared_ids))
+        return ids[node]
+
+    return tuple(renumber(n, ids) for n in node)
+
+
+def load_operator(node):
+    return Operator(renumber(node, {}))
+
+
+class ExpressionSource(object):
+    """ Generate the source of the lambda of an expression tree """
+
+    def __init__(self, argname="_{}", inline=False):
+        self.argname = argname
+        self.inline = inline
+        self.args = []
+        self.shared = {}
+        self.namespace = dict(EXPRESSION_GLOBALS)
+
+    def constant(self, value):
+        if self.inline or type(value) in LITERAL_TYPES:
+            source = repr(value)
+            # -2 ** x is -(2 ** x)
+            if source.startswith("-"):
+                source = "({})".format(source)
+            return source
+
+        name = "_c{}".format(len(self.namespace))
+        self.namespace[name] = value
+        return name
+
+    def emit(self, node):
+        kind = node[0]
+
+        if kind == "arg":
+            name = self.argname.format(len(self.args))
+            self.args.append(name)
+            return name
+
+        if kind == "shared":
+            if node not in self.shared:
+                self.shared[node] = self.emit(("arg",))
+            return self.shared[node]
+
+        if kind == "const":
+            return self.constant(node[1])
+
+        if kind == "binop":
+            left = self.emit(node[2])
+            return "({} {} {})".format(left, node[1], self.emit(node[3]))
+
+        if kind == "logic":
+            left = self.emit(node[2])
+            return "_{}({}, {})".format(node[1], left, self.emit(node[3]))
+
+        if kind == "and":
+            left = self.emit(node[1])
+            return "({} and {})".format(left, self.emit(node[2]))
+
+        if kind == "unary":
+            return "({}{})".format(node[1], self.emit(node[2]))
+
+        if kind == "getitem":
+            obj = self.emit(node[1])
+            return "{}[{}]".format(obj, self.emit(node[2]))
+
+        if kind == "getattr":
+            return "{}.{}".format(self.emit(node[1]), node[2])
+
+        if kind == "call":
+            obj = self.emit(node[1])
+            args = [self.emit(n) for n in node[3]]
+            args += ["{}={}".format(k, self.emit(n)) for k, n in node[4]]
+            return "{}.{}({})".format(obj, node[2], ", ".join(args))
+
+        if kind == "apply":
+            function = node[1]
+            name = function if isinstance(function, str) else self.constant(function)
+            return "{}({})".format(name, ", ".join(self.emit(n) for n in node[2]))
+
+        raise ValueError("Unknown expression node: {!r}".format(kind))
+
+
+ELEMENTWISE_NODES = ("arg", "shared", "const", "binop", "logic", "unary")
+
+
+def is_elementwise(node):
+    """
+    True if the expression only uses arithmetic, comparisons and logic,
+    so applied to a NumPy array it gives the same result as applying
+    it to each element.
+    """
+    kind = node[0]
+
+    if kind == "apply" and node[1] == "abs":
+        return is_elementwise(node[2][0])
+
+    if kind not in ELEMENTWISE_NODES:
+        return False
+
+    return all(is_elementwise(n) for n in node[1:] if isinstance(n, tuple) and kind != "const")
+
+
+def is_const(node):
+    return node[0] == "const"
+
+
+def compile_expression(node):
+    """
+    Compile an expression tree into a function. The common shapes
+    X[key], X.name and X.call(name, ...) use operator.itemgetter,
+    attrgetter and methodcaller, the others are compiled into a single
+    lambda with eval.
+    """
+    kind = node[0]
+
+    if kind == "arg":
+        return identity
+
+    if node[1] == ("arg",):
+
+        if kind == "getitem" and is_const(node[2]):
+            return operator.itemgetter(node[2][1])
+
+        if kind == "getattr":
+            return operator.attrgetter(node[2])
+
+        if kind == "call" and all(map(is_const, node[3])) and all(is_const(n) for _, n in node[4]):
+            return operator.methodcaller(node[2], *[n[1] for n in node[3]],
+                                         **{k: n[1] for k, n in node[4]})
+
+    source = ExpressionSource()
+    body = source.emit(node)
+    return eval("lambda {}: {}".format(", ".join(source.args), body), source.namespace)
+
+
+class Operator(object):
+    """
+    Operator to Generate Lambda expressions
+
+    Scala-style lambdas definition
+
+    Idea from: https://github.com/kachayev/fn.py#fnpy-enjoy-fp-in-python
+
+    The operations on X build an expression tree that is compiled,
+    the first time it is called, into a single function. Each X in the
+    expression is a new argument, so X + X is a function of two arguments.
+    Attributes are accessed with X.name and methods called with
+    X.call(name, *args). The two sides of & and | are predicates on the
+    same argument and both are evaluated. With NumPy arrays the arithmetic
+    and comparisons are vectorized, & and | use numpy.logical_and and
+    logical_or.
+
+    Example:
+
+    In [1]: from functional import X, mapl, filterl
+
+    In [2]: list(filter(X  < 10, [9, 10, 11]))
+    Out[2]: [9]
+
+    In [4]: mapl(X ** 2, [1, 2, 3, 4, 5, 6, 7])
+    Out[4]: [1, 4, 9, 16, 25, 36, 49]
+
+    In [2]: mapl(X  / 10, [9, 10, 11])
+    Out[2]: [0.9, 1.0, 1.1]
+
+    In [3]:  mapl( 10/X, [9, 10, 11])
+    Out[3]: [1.1111111111111112, 1.0, 0.9090909090909091]
+
+    In [5]: mapl((X + 1) * 2 % 3, [1, 2, 3])
+    Out[5]: [1, 0, 2]
+
+    In [6]: mapl(X.call("upper")[:2], ["abc", "def"])
+    Out[6]: ['AB', 'DE']
+
+    In [7]: filterl((X > 1) & (X < 4), range(6))
+    Out[7]: [2, 3]
+    """
+
+    __slots__ = ("_node", "_fn")
+
+    # Make NumPy call the reflected operators instead of
+    # broadcasting the expression over the array.
+    __array_ufunc__ = None
+
+    __hash__ = object.__hash__
+
+    def __init__(self, node=("arg",)):
+        self._node = node
+        self._fn = None
+
+    def __reduce__(self):
+        # The compiled function can't be pickled, only the tree is
+        return load_operator, (self._node,)
+
+    def compile(self):
+        """ Return the compiled function of the expression """
+        fn = self._fn
+        if fn is None:
+            fn = self._fn = compile_expression(self._node)
+        return fn
+
+    def __call__(self, *args):
+        return self.compile()(*args)
+
+    @property
+    def arity(self):
+        """ Number of arguments of the expression """
+        source = ExpressionSource()
+        source.emit(self._node)
+        return len(source.args)
+
+    @property
+    def elementwise(self):
+        """ True if the expression can be evaluated on a whole array at once """
+        return is_elementwise(self._node)
+
+    @property
+    def shares_argument(self):
+        """ True if the argument is used more than once, as in (X > 1) & (X < 4) """
+        source = ExpressionSource()
+        source.emit(self._node)
+        return bool(source.shared)
+
+    @property
+    def source(self):
+        """ Python source of the expression, with X for the arguments """
+        return ExpressionSource("X", inline=True).emit(self._node)
+
+    def then(self, other):
+        """
+        Return the expression that applies other to the result of
+        this one, other must have one argument.
+
+        >>> ((X + 1).then(X * 2))(3)
+        8
+        """
+        if isinstance(other, Operator) and other.arity != 1:
+            raise ValueError("Expression must have one argument: {!r}".format(other))
+
+        if not isinstance(other, Operator) or other.shares_argument:
+            return Operator(("apply", native(other), (self._node,)))
+
+        return Operator(substitute(lift(other), self._node))
+
+    def __repr__(self):
+        return self.source
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return Operator(("getattr", self._node, name))
+
+    def __getitem__(self, key):
+        return Operator(("getitem", self._node, lift(key)))
+
+    def _binop(self, op, other):
+        return Operator(("binop", op, self._node, lift(other)))
+
+    def _rbinop(self, op, other):
+        return Operator(("binop", op, lift(other), self._node))
+
+    def __add__(self, other):
+        return self._binop("+", other)
+
+    def __radd__(self, other):
+        return self._rbinop("+", other)
+
+    def __mul__(self, other):
+        return self._binop("*", other)
+
+    def __rmul__(self, other):
+        return self._rbinop("*", other)
+
+    def __sub__(self, other):
+        return self._binop("-", other)
+
+    def __rsub__(self, other):
+        return self._rbinop("-", other)
+
+    def __truediv__(self, other):
+        return self._binop("/", other)
+
+    def __floordiv__(self, other):
+        return self._binop("//", other)
+
+    def __rtruediv__(self, other):
+        return self._rbinop("/", other)
+
+    def __rfloordiv__(self, other):
+        return self._rbinop("//", other)
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __mod__(self, other):
+        return self._binop("%", other)
+
+    def __rmod__(self, other):
+        return self._rbinop("%", other)
+
+    def __pow__(self, other):
+        return self._binop("**", other)
+
+    def __rpow__(self, other):
+        return self._rbinop("**", other)
+
+    def __neg__(self):
+        return Operator(("unary", "-", self._node))
+
+    def __pos__(self):
+        return Operator(("unary", "+", self._node))
+
+    def __abs__(self):
+        return Operator(("apply", "abs", (self._node,)))
+
+    def __eq__(self, other):
+        return self._binop("==", other)
+
+    def __ne__(self, other):
+        return self._binop("!=", other)
+
+    def __lt__(self, other):
+        return self._binop("<", other)
+
+    def __le__(self, other):
+        return self._binop("<=", other)
+
+    def __gt__(self, other):
+        return self._binop(">", other)
+
+    def __ge__(self, other):
+        return self._binop(">=", other)
+
+    def _logic(self, op, other):
+        left, right = self._node, lift(other)
+
+        if isinstance(other, Operator) and self.arity == 1 and other.arity == 1:
+            shared = ("shared", next(shared_ids))
+            left, right = substitute(left, shared), substitute(right, shared)
+
+        return Operator(("logic", op, left, right))
+
+    def __or__(self, other):
+        return self._logic("or", other)
+
+    def __and__(self, other):
+        return self._logic("and", other)
+
+    def __rand__(self, other):
+        return Operator(("logic", "and", lift(other), self._node))
+
+    def __ror__(self, other):
+        return Operator(("logic", "or", lift(other), self._node))
+
+    def call(self, name, *args, **kwargs):
+        """ Generate the expression that calls the method name """
+        return Operator(("call", self._node, name, tuple(map(lift, args)),
+                         tuple((k, lift(v)) for k, v in kwargs.items())))
+
+    def split(self, pattern=' '):
+        return self.call("split", pattern)
+
+    def strip(self):
+        return self.call("strip")
+
+    def map(self, function):
+        return Operator(("apply", "_map", (("const", function), self._node)))
+
+    def sum(self):
+        return Operator(("apply", "_sum", (self._node,)))
+
+    def len(self):
+        return Operator(("apply", "len", (self._node,)))
+
+    def key(self, keyname):
+        """Generate lambda expression for dictionary key """
+        return self[keyname]
+
+    def item(self, it):
+        """Generate lambda function for list item """
+        return self[it]
+
+
+X = Operator()
+
+
+def conjunction(predicates):
+    """
+    Return the expression that is true when all the one argument
+    predicates are. Unlike &, the predicates are evaluated in order
+    with a short-circuit and, so it only works on scalars.
+
+    >>> conjunction([X > 1, X < 4])(2)
+    True
+    """
+    shared = ("shared", next(shared_ids))
+    nodes = [substitute(predicate._node, shared) for predicate in predicates]
+    return Operator(functools.reduce(lambda left, right: ("and", left, right), nodes))
+
+
+def native(function):
+    """ Return the compiled function of an X expression or function itself """
+    if isinstance(function, Operator):
+        return function.compile()
+    return function
+
+
+#############################
+#   TYPE CHECKING           #
+#############################
+
+POSINF = 1e200  # Negative Infinite number
+NEGINF = -1e200  # Positive infinite number
+
+
+def is_list(var):
+    """
+    Test if variable var is list
+
+    :return: True if var is list, False if var is not list
+    :rtype:  bol
+    """
+    return isinstance(var, list)
+
+
+def is_tuple(var):
+    return isinstance(var, tuple)
+
+
+def is_num(var):
+    """
+    Test if variable var is number (int or float)
+
+    :return: True if var is number, False otherwise.
+    :rtype:  bol
+    """
+    return isinstance(var, int) or isinstance(var, float)
+
+
+def is_dict(var):
+    return isinstance(var, dict)
+
+
+def is_string(var):
+    return isinstance(var, str)
+
+
+def is_function(var):
+    """
+    Test if variable is function (has a __call__ attribute)
+
+    :return: True if var is function, False otherwise.
+    :rtype:  bol
+    """
+    return hasattr(var, '__call__')
+
+
+def is_none(var):
+    return var is None
+
+
+def is_empty(lst):
+    return not lst
+
+
+def is_finite(x):
+    return NEGINF < x < POSINF
+
+
+def is_pos(x):
+    return x > 0
+
+
+def is_neg(x):
+    return x < 0
+
+
+#############################
+#      PRIMITIVES           #
+#############################
+
+def flat(List):
+    return list(itertools.chain(*List))
+
+def identity(x):
+    return x
+
+
+def constantly(value):
+    """
+    Creates a function that returns the same value that is used
+    as the argument of
+
+    >>> import function as f
+    >>> std_gravity = f.constantly(9.81) # m/s2
+    >>> std_gravity(2)
+    9.81
+    """
+
+    def f(x):
+        return value
+
+    return f
+
+
+def nope():
+    pass
+
+
+def contains(lst, value):
+    return value in lst
+
+
+def mapl(function, array):
+    """
+    Map a function to an array
+    (equivalent to python2 map)
+
+    :param function: Function to be mapped
+    :param array:    List of values
+    :return:         List of returns values
+
+    f = function
+    array = [x0, x1, x2, ... xn]
+    [f(x0), f(x1), f(x2) ... f(xn)] = mapl(f, array)
+
+    Example:
+
+    >>> from m2py import functional as f
+    >>> fun = lambda x: x**2
+    >>> f.mapl(fun, [1, 2, 3, 4, 5, 6])
+    [1, 4, 9, 16, 25, 36]
+
+    """
+    return list(map(native(function), array))
+
+
+def flat_mapl(function, array):
+    return flat(mapl(function, array))
+
+def filterl(predicate, List):
+    return list(filter(native(predicate), List))
+
+def filterl_index(predicate, List):
+    """
+    Return the index of elements that satisfy the predicate function.
+
+    :param predicate:
+    :param List:
+    :return:
+    """
+    result = []
+
+    for idx, e in enumerate(List):
+
+        if predicate(e):
+            result.append(idx)
+
+    return result
+
+def pick(List, list_of_index):
+    return [List[i] for i in list_of_index]
+
+
+def starmap(function, arglist):
+    """
+    map tuple
+    
+    Map list of function arguments to the function
+
+    :param function: Function of tuples
+    :param arglist:  List of arguments of f
+    :return:         list of results
+
+    Let be
+        function: f( a, b, c, d, ...)
+        arglist :  [ (a0, b0, c0, ...), (ak, bk, ck, ...), ... ]
+
+        Xk = [ ak, bk, ck, ... ]
+        return [ f(X0), f(X1), ... f(Xn)]
+
+    Example:
+
+    >>> from m2py import functional as f
+    >>>
+    >>> x= [ (0, 2, 4), (-3, 4, 8), (4, 2, 5), (22, -10, 23)]
+    >>>
+    >>> def fun(a, b, c): return a**2 - 10*b + c
+    ...
+    >>>
+    >>> f.maplx(fun, x)
+    [-16, -23, 1, 607]
+    """
+    return list([function(*params) for params in arglist])
+
+
+def zipl(*lists):
+    """
+    Equivalent to python2 zip, return a list instead
+    of a generatory in python3
+    """
+    return list(zip(*lists))
+
+
+def reducel(function, array):
+    """
+    Example:
+
+    >>> from m2py import functional as f
+    >>> >>> f.reduce(lambda a, b: a*b, [ 1, 2, 3, 4, 5])
+    120
+    >>>
+    >>> f.reduce(lambda a, b: a+b, [ 1, 2, 3, 4, 5, 6, 7, 8])
+    36
+    >>>
+    """
+
+    y = array[0]
+
+    for i in range(len(array) - 1):
+        #print("array = ", array)
+        #print("y = ", y)
+        y = function(y, array[i + 1])
+
+    return y
+
+
+def mapif(predicate, function, list):
+    """
+
+    """
+    result = list.copy()
+
+    for i, x in enumerate(list):
+
+        if predicate(x):
+            result[i] = function(x)
+
+    return result
+
+
+def joinf(funclist):
+    """
+    Map a list of functions to an array
+
+    :param funclist: List of functions  [ f0, f1, f2 .. fk]
+    :param array:    List of values     x= [ x0, x1, x2, ... xn]
+    :return:         [map(f0, x), map(f1, x), ... map(fn, x)]
+
+
+    juxt takes two or more functions and returns a function that returns
+    a vector containing the results of applying each function on its
+    arguments. In other words, ((juxt a b c) x) => [(a x) (b x) (c x)].
+    This is useful whenever you want to represent the results of using 2
+    different functions on the same argument(s), all at once rather than separately:
+
+    Example:
+
+    >>> from m2py import functional as f
+    >>>
+    >>> x = [1, 2, 3, 4, 5]
+    >>> fun1 = lambda x: x**2 - 10.0
+    >>> fun2 = lambda x: 10*x + 8
+    >>> fun3 = lambda x: 100.0/x - 4
+    >>> fun= [fun1, fun2, fun3 ]
+    >>> f.joinfuncs(fun, x)
+    [[-9.0, -6.0, -1.0, 6.0, 15.0],
+     [18, 28, 38, 48, 58],
+     [96.0, 46.0, 29.333333333333336, 21.0, 16.0]]
+
+
+    Note: Function taken from cloujure and R
+    https://clojuredocs.org/clojure.core/juxt
+    """
+
+    def joined_functions(x):
+        return [f(x) for f in funclist]
+
+    return joined_functions
+    #return [ list(map(fi, array)) for fi in funclist ]
+
+
+def currying(function, variable, **constants):
+    """
+    :param function:  Function
+    :param variable:  Variable symbol (str), free parameter
+    :param constants: Constant parameters dictionary
+    :return:          Curried function
+
+    Example:
+
+    Create a new function fun_x(x) from f(x)
+    such that fun_x(x) = fun(x, y=2, z=3)
+
+    >>> from m2py import functional as f
+    >>>
+    >>> def fun(x, y, z): return x**2 - y*z
+    ...
+    >>> fun_x = f.currying(fun, "x", y=2, z=3)
+    >>> f.mapl(fun_x, [2, 3, 4, 5, 7])
+    [-2, 3, 10, 19, 43]
+    """
+
+    params = constants
+
+    def curried_function(x):
+        params[variable] = x
+        return function(**params)
+
+    return curried_function
+
+
+def compose(*funclist):
+    """
+    Returns the composition of a list of functions, where each function
+    consumes the return value of the function that follows. In math terms,
+    composing the functions f()
+
+    :param funclist: List of functiosn [f0, f1, f2, f3, ... fn-1]
+    :return:         New function f(x) = f0(f1(...fn-3(fn-2(fn-1(x))))
+    :type funclist:  list(function)
+    :rtype funclist: function
+
+    Create f(x) such that
+
+    f(x) = (f0.f1.f2...fn-1)(x)
+
+
+    Example:
+
+    Compute inc(double(10)) = 21
+
+    >>>
+    >>> imoort functional as f
+    >>>
+    >>> inc = lambda x: x+1
+    >>> double = lambda x: x*2
+    >>>
+    >>> f.compose(inc, double)(10)
+    21
+    """
+    flist = list(funclist)
+    flist.reverse()
+
+    def f(x):
+        _x = x
+
+        for f in flist:
+            _x = f(_x)
+
+        return _x
+
+    return f
+
+
+def pipe(*funclist):
+    """
+    Returns the composition of a list of functions, where each function
+    consumes the return value of the function that follows. In math terms,
+    composing the functions f()
+
+    :param funclist: List of functiosn [f0, f1, f2, f3, ... fn-1]
+    :return:         New function f(x) = f0(f1(...fn-3(fn-2(fn-1(x))))
+    :type funclist:  list(function)
+    :rtype funclist: function
+
+    Create f(x) such that
+
+    f(x) = (f0.f1.f2...fn-1)(x)
+
+
+    Example:
+
+    Compute inc(double(10)) = 21
+
+    >>>
+    >>> imoort functional as f
+    >>>
+    >>> inc = lambda x: x+1
+    >>> double = lambda x: x*2
+    >>>
+    >>> f.compose(inc, double)(10)
+    21
+    """
+
+    def f(x):
+        _x = x
+
+        for f in funclist:
+            _x = f(_x)
+
+        return _x
+
+    return f
+
+
+def zipwith(Combine, *Lists):
+    """
+    Combine the elements of two lists of equal length into one list.
+    For each pair X, Y of list elements from the two lists, the element
+    in the result list will be Combine(X, Y).
+
+    zipwith(fun(X, Y) -> {X,Y} end, List1, List2) is equivalent to zip(List1, List2).
+
+    Example:
+    >>> from m2py.functional.hof import zipwith
+    >>>
+    >>> f = lambda x, y, z: x**2+y**2 - z
+    >>> zipwith(f, [1, 2, 3], [4, 5, 6], [3, 9, 8])
+    [14, 20, 37]
+
+    Note: Function taken from Erlang -
+    http://erldocs.com/17.3/stdlib/lists.html#zipwith
+    """
+    return [Combine(*row) for row in zip(*Lists)]
+
+
+def ifelse(condition, trueValue, falseValue):
+    """
+    :param condition:   Flag
+    :param trueValue:   Return value if flag is True
+    :param falseValue:  Return value if flag is False
+    :type  condition:   Flag (bol value) True/False
+    :return:            trueValue if condition is True, FalseValue otherwise
+
+    Example:
+
+    >>> from m2py import functional as f
+    >>>
+    >>> x = 3
+    >>>
+    >>> f.ifelse(x> 2, x**2, x-10)
+    9
+    >>> x= 1
+    >>> f.ifelse(x> 2, x**2, x-10)
+    -9
+    >>> x= 2
+    >>> f.ifelse(x> 2, x**2, x-10)
+    -8
+    >>>
+
+    """
+    out = [falseValue, trueValue][condition]
+
+    return out
+
+
+def ifelsef(condition, trueFunction, falseFunction=identity):
+    """
+    :param condition:       Condition function
+    :param trueFunction:    Function to be executed if condition is True
+    :param falseFunction:   Function to be executed if condition is False
+    :type condition:        function
+    :type trueFunction:     function
+    :type falseFunction:    function
+    :return:                Conditional function
+
+    Create a new function such that
+
+    function(x):
+     if condition(x):
+        return trueFun(x)
+     else
+        return falseFun(x)
+
+    Example:
+
+    Crete
+                /  x^2  , if x < 3
+        f(x)  =
+                \  x/3  , if x >= 3
+
+    >>> from m2py import functional as f
+    >>>
+    >>> fx = f.ifelsef(lambda x: x<3, lambda x: x**2, lambda x: x/3.0)
+    >>>
+    >>> f.mapl(fx, [-3, -2, -1, 0, 1, 2, 3, 6, 9, 18, 27])
+    [9, 4, 1, 0, 1, 4, 1.0, 2.0, 3.0, 6.0, 9.0]
+    >>>
+    >>> fx = f.ifelsef(lambda x: x<3, f.constant(0))
+    >>> f.mapl(fx, [-3, -2, -1, 0, 1, 2, 3, 6, 9, 18, 27])
+    [0, 0, 0, 0, 0, 0, 3, 6, 9, 18, 27]
+    >>>
+    """
+
+    def func(x):
+        return [falseFunction, trueFunction][condition(x)](x)
+
+    return func
+
+
+def nest(function, n):
+    """
+    fp::nest(f,n) returns the n-fold repeated composition of the function f.
+    Thus, given the function f, fp::nest returns the identity function
+    id if n is 0 and otherwise the function
+
+    Return f(f(f(f..f(x))))
+
+    Note: Function taken from Matlab Mupad DOC
+    http://www.mathworks.com/help/symbolic/mupad_ref/fp-nest.html
+    """
+
+    def f(x):
+        x_ = x
+        for i in range(n):
+            x_ = function(x_)
+
+        return x_
+
+    return f
+
+
+RetryStats = collections.namedtuple("RetryStats", "calls attempts retries slept giveups")
+
+
+class CircuitOpenError(Exception):
+    """ Raised when a call is rejected because the circuit breaker is open """
+
+
+class CircuitBreaker(object):
+    """
+    Circuit breaker that can be shared by several retry policies.
+
+    :param failures:      Number of consecutive failures that open the circuit
+    :param reset_timeout: Seconds the circuit stays open before letting
+                          probe calls through (half-open)
+    :param probes:        Number of calls allowed while half-open
+
+    While open all the calls are rejected with CircuitOpenError. A successful
+    probe closes the circuit and a failed one opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failures=5, reset_timeout=30.0, probes=1):
+        self.failures = failures
+        self.reset_timeout = reset_timeout
+        self.probes = probes
+
+        self._lock = threading.Lock()
+        self._count = 0
+        self._opened = None
+        self._probing = 0
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self._opened is None:
+            return self.CLOSED
+
+        if time.monotonic() - self._opened < self.reset_timeout:
+            return self.OPEN
+
+        return self.HALF_OPEN
+
+    def allow(self):
+        """ Return True if a call can go through """
+        with self._lock:
+            state = self._state()
+
+            if state == self.CLOSED:
+                return True
+
+            if state == self.HALF_OPEN and self._probing < self.probes:
+                self._probing += 1
+                return True
+
+            return False
+
+    def success(self):
+        with self._lock:
+            self._count = 0
+            self._opened = None
+            self._probing = 0
+
+    def failure(self):
+        with self._lock:
+            self._count += 1
+
+            if self._opened is not None or self._count >= self.failures:
+                self._opened = time.monotonic()
+                self._probing = 0
+
+    def release(self):
+        """
+        Give back a half-open probe slot without reporting a success or
+        a failure, used when the call raised an error that is not retried.
+        """
+        with self._lock:
+            if self._probing > 0:
+                self._probing -= 1
+
+    def reset(self):
+        self.success()
+
+    def __repr__(self):
+        return "CircuitBreaker(state={!r}, failures={})".format(self.state, self._count)
+
+
+class RetryPolicy(object):
+    """
+    Describe how a call is retried, it is used by retry, retrying and
+    hof.aio.aretry and can be shared by many calls.
+
+    :param tries:     Maximum number of attempts, None for no limit
+    :param errors:    Exception or tuple of exceptions that are retried
+    :param delay:     Seconds to wait after the first failure
+    :param backoff:   Multiplier of the delay after each failure
+    :param max_delay: Upper bound of the delay
+    :param jitter:    If True wait a random time between 0 and the
+                      delay (full jitter)
+    :param deadline:  Maximum seconds since the first attempt, no retry
+                      is done if its delay would go beyond it.
+    :param retry_on:  Predicate on the result, the call is retried if it
+                      returns True. After the last attempt the result
+                      is returned.
+    :param breaker:   CircuitBreaker
+    :param on_retry:  Function called as on_retry(attempt, outcome, delay)
+                      before sleeping, outcome is the exception or result.
+    :param on_giveup: Function called as on_giveup(attempt, outcome)
+
+    The counters are returned by stats().
+    """
+
+    def __init__(self, tries=3, errors=Exception, delay=0, backoff=2, max_delay=None,
+                 jitter=False, deadline=None, retry_on=None, breaker=None,
+                 on_retry=None, on_giveup=None):
+        self.tries = tries
+        self.errors = errors
+        self.delay = delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_on = retry_on
+        self.breaker = breaker
+        self.on_retry = on_retry
+        self.on_giveup = on_giveup
+
+        self._lock = threading.Lock()
+        self._stats = dict(calls=0, attempts=0, retries=0, slept=0.0, giveups=0)
+
+    def stats(self):
+        with self._lock:
+            return RetryStats(**self._stats)
+
+    def _count(self, **increments):
+        with self._lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+
+    def backoff_delay(self, attempt):
+        """ Return the delay after the failed attempt (starting at 1) """
+        delay = self.delay * self.backoff ** (attempt - 1)
+
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        return delay
+
+    def before(self, attempt):
+        """ Called before each attempt, raise CircuitOpenError if rejected """
+        if self.breaker is not None and not self.breaker.allow():
+            raise CircuitOpenError("circuit breaker is open")
+
+        self._count(calls=int(attempt == 1), attempts=1)
+
+    def succeeded(self, attempt, result):
+        """ Return True if the result must be retried """
+        if self.retry_on is not None and self.retry_on(result):
+            if self.breaker is not None:
+                self.breaker.failure()
+            return True
+
+        if self.breaker is not None:
+            self.breaker.success()
+
+        return False
+
+    def failed(self, attempt, error):
+        """ Return True if the exception must be retried """
+        if not isinstance(error, self.errors):
+            self.release()
+            return False
+
+        if self.breaker is not None:
+            self.breaker.failure()
+
+        return True
+
+    def release(self):
+        """ Called when the call is aborted by an error that is not retried """
+        if self.breaker is not None:
+            self.breaker.release()
+
+    def next_delay(self, attempt, started, outcome):
+        """
+        Return the seconds to wait before the next attempt or None
+        if the policy gives up.
+        """
+        delay = None
+
+        if self.tries is None or attempt < self.tries:
+            delay = self.backoff_delay(attempt)
+
+            if self.deadline is not None and time.monotonic() - started + delay > self.deadline:
+                delay = None
+
+        if delay is None:
+            self._count(giveups=1)
+
+            if self.on_giveup is not None:
+                self.on_giveup(attempt, outcome)
+        else:
+            self._count(retries=1, slept=delay)
+
+            if self.on_retry is not None:
+                self.on_retry(attempt, outcome, delay)
+
+        return delay
+
+    def outcome(self, attempt, started, error=None, result=None):
+        """
+        Record the outcome of an attempt and return the seconds to wait
+        before the next one, or None if the result must be returned.
+        The error is raised again if it is not retried.
+        """
+        if error is not None:
+            if not isinstance(error, Exception):
+                self.release()
+                raise error
+
+            if not self.failed(attempt, error):
+                raise error
+
+            delay = self.next_delay(attempt, started, error)
+
+            if delay is None:
+                raise error
+
+            return delay
+
+        if not self.succeeded(attempt, result):
+            return None
+
+        return self.next_delay(attempt, started, result)
+
+    def __call__(self, call):
+        """ Call call() until it succeeds or the policy gives up """
+        started = time.monotonic()
+
+        for attempt in itertools.count(1):
+            self.before(attempt)
+
+            try:
+                result = call()
+            except BaseException as error:
+                delay = self.outcome(attempt, started, error=error)
+            else:
+                delay = self.outcome(attempt, started, result=result)
+
+                if delay is None:
+                    return result
+
+            if delay > 0:
+                time.sleep(delay)
+
+
+def retry(call, tries=3, errors=Exception, policy=None, **options):
+    """
+    Call call() until it succeeds or the tries are exhausted,
+    the last exception is raised.
+
+    :param call:    Function without arguments
+    :param tries:   Maximum number of attempts
+    :param errors:  Exception or tuple of exceptions that are retried
+    :param policy:  RetryPolicy, if given the other parameters are ignored
+    :param options: Other RetryPolicy parameters (delay, backoff, max_delay,
+                    jitter, deadline, retry_on, breaker, on_retry, on_giveup)
+
+    Example:
+
+    >>> breaker = CircuitBreaker(failures=10, reset_timeout=60)
+    >>> retry(lambda: urlopen(url), tries=5, errors=IOError,
+    ...       delay=0.1, jitter=True, deadline=10, breaker=breaker)
+    """
+    if policy is None:
+        policy = RetryPolicy(tries, errors, **options)
+
+    return policy(call)
+
+
+def retrying(tries=3, errors=Exception, policy=None, **options):
+    """
+    Decorator form of retry, coroutine functions are retried with
+    hof.aio.aretry.
+
+    Example:
+
+    >>> @retrying(tries=5, errors=IOError, delay=0.1, jitter=True)
+    ... def fetch(url):
+    ...     return urlopen(url).read()
+    """
+    if policy is None:
+        policy = RetryPolicy(tries, errors, **options)
+
+    def decorator(function):
+        if inspect.iscoroutinefunction(function):
+            from .aio import aretry
+
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                return await aretry(lambda: function(*args, **kwargs), policy=policy)
+
+            async_wrapper.policy = policy
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            return policy(lambda: function(*args, **kwargs))
+
+        wrapper.policy = policy
+        return wrapper
+
+    return decorator
+
+
+def ignore(call, errors=Exception):
+    try:
+        return call()
+    except errors:
+        return None
+
+
+def in_sequence(function_list):
+    """
+    Create a new function that execute the functions
+    in the list in sequence.
+
+    :param function_list: List of functions
+    :return:              Function
+
+    """
+
+    def seqfun():
+        for f in function_list: f()
+
+    return seqfun
+
+
+POOL_WORKERS = 32
+
+_pool = None
+_pool_lock = threading.Lock()
+_pool_thread = threading.local()
+
+
+def mark_pool_thread():
+    _pool_thread.active = True
+
+
+def in_pool_thread():
+    """ Return True if the current thread belongs to the shared pool """
+    return getattr(_pool_thread, "active", False)
+
+
+def get_pool():
+    """
+    Return the shared, long lived ThreadPoolExecutor with POOL_WORKERS
+    threads. The threads are created on demand and reused by all the
+    calls of in_parallel and pmap.
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=POOL_WORKERS, thread_name_prefix="hof",
+                                       initializer=mark_pool_thread)
+        return _pool
+
+
+def run_future(future, call):
+    if not future.set_running_or_notify_cancel():
+        return
+
+    try:
+        result = call()
+    except BaseException as error:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+def submit_all(calls, workers=None):
+    """
+    Run the functions without arguments in calls on the shared pool,
+    with at most workers of them running at the same time, and return
+    their futures in order.
+
+    Only workers tasks are submitted to the pool, each one runs the
+    pending calls one after the other, so a cancelled future is just
+    skipped. Calls made from a thread of the pool run inline in that
+    thread, waiting for the pool from one of its own threads could
+    block it forever.
+    """
+    futures = [Future() for _ in calls]
+    pending = collections.deque(zip(futures, calls))
+
+    if in_pool_thread():
+        for future, call in pending:
+            run_future(future, call)
+        return futures
+
+    lock = threading.Lock()
+
+    def runner():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                future, call = pending.popleft()
+
+            run_future(future, call)
+
+    pool = get_pool()
+
+    for _ in range(min(workers or POOL_WORKERS, len(futures))):
+        pool.submit(runner)
+
+    return futures
+
+
+def gather(futures, timeout=None):
+    """
+    Wait for a list of futures and return their results in order.
+    If one of them fails or the timeout expires, the pending futures
+    are cancelled and the exception (or TimeoutError) is raised.
+    """
+    try:
+        for future in as_completed(futures, timeout):
+            error = future.exception()
+
+            if error is not None:
+                # The finally block cancels the pending futures first
+                raise error
+
+        return [future.result() for future in futures]
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def in_parallel(function_list, workers=None, wait=False, timeout=None):
+    """
+    Create a new function that execute the functions
+    in the list in parallel on the shared thread pool.
+
+    :param function_list: List of functions
+    :param workers:       Maximum number of functions running at the same
+                          time (default: POOL_WORKERS)
+    :param wait:          If True the function waits and returns the results,
+                          the exceptions raised by the functions are propagated.
+                          Otherwise it returns the list of futures.
+    :param timeout:       Seconds to wait for the results when wait is True,
+                          the pending functions are cancelled on timeout.
+    :return:              Function
+
+    The functions run on the POOL_WORKERS threads shared with pmap.
+    Long running functions started without waiting (like the example)
+    keep those threads busy, and the pool threads are joined when the
+    interpreter exits, so they delay the process shutdown until they
+    return.
+
+    Example:
+
+    >>> from m2py import functional as funcp
+    >>>
+    >>> import time
+    >>>
+    >>> def print_time(thname, delay):
+    ...   for i in range(5):
+    ...      time.sleep(delay)
+    ...      print (thname, " ", time.ctime(time.time()))
+    >>>
+    >>> def make_print_time(name, delay): return lambda : print_time(name, delay)
+    >>>
+    >>> t1 = make_print_time("thread1", 1)
+    >>> t2 = make_print_time("thread2", 2)
+    >>> t3 = make_print_time("thread3", 3)
+    >>> t4 = make_print_time("thread4", 4)
+    >>>
+    >>> thfun = funcp.in_parallel([t1, t2, t3, t4])
+    >>> thfun()
+    >>> thread1   Fri Dec 26 23:40:29 2014
+    thread2   Fri Dec 26 23:40:30 2014
+    thread1   Fri Dec 26 23:40:30 2014
+    thread3   Fri Dec 26 23:40:31 2014
+    thread1   Fri Dec 26 23:40:31 2014
+    thread4   Fri Dec 26 23:40:32 2014
+    thread2   Fri Dec 26 23:40:32 2014
+    thread1   Fri Dec 26 23:40:32 2014
+    thread1   Fri Dec 26 23:40:33 2014
+    ...
+    """
+
+    def pfun():
+        futures = submit_all(function_list, workers)
+
+        if wait:
+            return gather(futures, timeout)
+
+        return futures
+
+    return pfun
+
+
+def run_chunk(function, chunk):
+    return [function(x) for x in chunk]
+
+
+def pmap(function, sequence, workers=None, chunksize=1, ordered=True, timeout=None):
+    """
+    Map a function to a sequence on the shared thread pool.
+
+    :param function:  Function to be mapped
+    :param sequence:  List or iterable of values
+    :param workers:   Maximum number of tasks running at the same time
+                      (default: POOL_WORKERS), all the calls share a
+                      single pool of POOL_WORKERS threads.
+    :param chunksize: Number of elements processed by each task
+    :param ordered:   If False the results are returned in the order
+                      they are completed.
+    :param timeout:   Seconds to wait for all the results, the pending
+                      tasks are cancelled and TimeoutError is raised.
+    :return:          List of results
+
+    When pmap is called from a function running on the pool (nested
+    pmap or in_parallel) it runs sequentially in the calling thread.
+
+    Example:
+
+    >>> pmap(fetch_url, urls, workers=64, chunksize=4)
+    """
+    items = list(sequence)
+    chunks = [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+    futures = submit_all([functools.partial(run_chunk, function, chunk) for chunk in chunks], workers)
+
+    if ordered:
+        return flat(gather(futures, timeout))
+
+    results = []
+
+    try:
+        for future in as_completed(futures, timeout):
+            results.extend(future.result())
+    finally:
+        for future in futures:
+            future.cancel()
+
+    return results
+
+
+def caller(function, args=(), kwargs=None):
+    """
+    :param function: Function object
+    :pram argds:     Function arguments tuple
+
+    In [11]: def f(x, y): return x+y
+
+    In [12]: call(f, (20, 100))()
+    Out[12]: 120
+
+    In [14]: def f2(): print("hello world")
+
+    In [15]: call(f2)
+    hello world
+    """
+    if not kwargs:
+        kwargs = {}
+    return lambda: function(*args, **kwargs)
+
+
+def call(function, args=(), kwargs=None):
+    if not kwargs:
+        kwargs = {}
+    return function(*args, **kwargs)
+
+
+def times(function, n):
+    """
+    Call a function n times
+
+    :param function: Function without argument
+    :pram  n:        Number of times to call
+    :return:         [y0, y1, y2 ... ]
+
+    for i in range(n):
+        yi = function()
+
+    Example:
+    >>> fromn functional import ncall
+    >>> from random import randint
+    >>>
+    >>> rnd= lambda : randint(0, 100)
+    >>> f.times(rnd, 10)
+    [84, 92, 31, 45, 32, 99, 38, 39, 89, 25]
+    """
+    for i in range(n):
+        function()
+
+
+def groupby(function, sequence):
+    """
+
+    Example:
+
+    >>> from m2py import functional as f
+    >>> f.groupby(len, ['Alice', 'Bob', 'Charlie', 'Dan', 'Edith', 'Frank'])
+    {3: ['Bob', 'Dan'], 5: ['Alice', 'Edith', 'Frank'], 7: ['Charlie']}
+    >>>
+    >>>
+    >>> f.groupby(f.is_even, [1, 2, 3, 4, 5, 6, 7])
+    {False: [1, 3, 5, 7], True: [2, 4, 6]}
+    >>>
+    """
+
+    output = {}
+
+    for x in sequence:
+        y = function(x)
+
+        if not output.get(y):
+            output[y] = [x]
+        else:
+            output[y].append(x)
+
+    return output
+
+
+def iterate(function, x):
+    """
+    Repeatedly apply a function func onto an original input
+    Yields x, then func(x), then func(func(x)), then func(func(func(x))), etc..
+
+    Example:
+
+
+    Fixed point Iteration : The transcendental equation f(x) = 0 can be converted algebraically into the form x = g(x) and then using the iterative scheme with the recursive relation
+    xi+1= g(xi),   i = 0, 1, 2, . . .,
+
+    Find a root of  x^4-x-10 = 0                                [ Graph]
+    Consider g1(x) = 10 / (x^3-1) and the fixed point
+    let the initial guess x0 be 2.0
+
+    >>> from m2py import functional as f
+    >>>
+    >>> itx = f.iterate(lambda x: 10.0/(x**3-10.0), 2)
+    >>> # Repeat function calls and accumulate return value
+    ...
+    >>> x = f.times(itx, 10)
+    >>> errx = f.diff(x)  # Calculate the differences  xi+1 - xi (error)
+    >>>
+    >>> f.disp(x, errx)
+    -5           4.92593
+    -0.0740741  -0.925885
+    -0.999959    0.0908584
+    -0.909101   -0.0210157
+    -0.930117    0.00459003
+    -0.925527   -0.00101653
+    -0.926543    0.000224452
+    -0.926319   -4.95924e-05
+    -0.926368    1.09558e-05
+    >>>
+    >>> root = x[-1]
+    >>> root
+    -0.926357323308913
+    >>>
+
+    Souce: http://mat.iitm.ac.in/home/sryedida/public_html/caimna/transcendental/iteration%20methods/fixed-point/iteration.html
+    """
+
+    def iterf():
+        y = function(iterf.x)
+        iterf.x = y
+        return y
+
+    iterf.x = x
+
+    return iterf
+
+
+def addl(list2, list1):
+    return [(b + a) for a, b in zip(list2, list1)]
+
+
+def difl(list2, list1):
+    return [(b - a) for b, a in zip(list2, list1)]
+
+
+def mull(list2, list1):
+    return [(b * a) for b, a in zip(list2, list1)]
+
+
+def divl(list2, list1):
+    return [(b / a) for b, a in zip(list2, list1)]
+
+
+def sliding_window(array, k):
+    """
+    A sequence of overlapping subsequences
+
+    Example:
+
+    >>> from m2py import functional as f
+    >>>
+    >>> x = ['x0', 'x1', 'x2', 'x3', 'x4', 'x5', 'x6', 'x7', 'x8', 'x9']
+    >>>
+    >>> print(f.sliding_window(x, 1))
+    [('x0',), ('x1',), ('x2',), ('x3',), ('x4',), ('x5',), ('x6',), ('x7',), ('x8',), ('x9',)]
+    >>>
+    >>> print(f.sliding_window(x, 2))
+    [('x0', 'x1'), ('x1', 'x2'), ('x2', 'x3'), ('x3', 'x4'), ('x4', 'x5'), ('x5', 'x6'), ('x6', 'x7'), ('x7', 'x8'), ('x8', 'x9')]
+    >>>
+    >>> print(f.sliding_window(x, 3))
+    [('x0', 'x1', 'x2'), ('x1', 'x2', 'x3'), ('x2', 'x3', 'x4'), ('x3', 'x4', 'x5'), ('x4', 'x5', 'x6'), ('x5', 'x6', 'x7'), ('x6', 'x7', 'x8'), ('x7', 'x8', 'x9')]
+    >>>
+
+    Note: http://toolz.readthedocs.org/en/latest/api.html#toolz.itertoolz.sliding_window
+    """
+    return list(zip(*[array[i:] for i in range(k)]))
+
+
+def dictzip(keys, values):
+    """
+    >>> dictzip(["x", "y", "z"], [1, 2,3])
+    {'y': 2, 'x': 1, 'z': 3}
+    """
+    return dict(list(zip(keys, values)))
+
+
+def transpose(matrix):
+    return list(zip(*matrix))
+
+
+def unzipl(matrix):
+    return list(zip(*matrix))
+
+
+def find(predicate, array):
+    """
+    find_.find(list, predicate, [context]) Alias: detect
+    Looks through each value in the list, returning the first one that
+    passes a truth test (predicate), or undefined if no value passes the
+    test. The function returns as soon as it finds an acceptable element,
+    and doesn't traverse the entire list.
+
+    var even = _.find([1, 2, 3, 4, 5, 6], function(num){ return num % 2 == 0; });
+    => 2
+    """
+    for x in array:
+        if predicate(x):
+            return x
+    return None
+
+
+def find_index(predicate, List):
+    """
+    (a → Boolean) → [a] → [Number]
+
+    Return the index of first element that satisfy the 
+    predicate
+    """
+    for i, x in enumerate(List):
+        if predicate(x):
+            return i
+
+
+def find_indices(predicate, List):
+    """
+    Returns an array of all the indices of the 
+    elements which pass the predicate. Returns an 
+    empty list if the predicate never passes.
+    find-indices even, [1 2 3 4] #=> [1, 3]
+    
+    >>> find_indices(lambda x: x > 2, [1, 2, 30, 404, 0, -1, 90])
+    [2, 3, 6]
+    """
+    result = []
+
+    for i, x in enumerate(List):
+        if predicate(x):
+            result.append(i)
+
+    return result
+
+
+def tail(list, n):
+    """ Return the last n elements of a list """
+    return list[n:]
+
+
+def head(list, n):
+    """Return the firsts n elements of a list """
+    return list[:n]
+
+
+def every(function, array):
+    """
+    every_.every(list, [predicate], [context]) Alias: all
+    Returns true if all of the values in the list pass the predicate truth test.
+
+    >>> from m2py import functional as f
+    >>> f.every(lambda x: x> 4, [1, 2, 3, 4, 5 ,6 , 7, 8])
+    False
+    >>>
+    >>>
+    >>> f.every(lambda x: x> 4, [5 ,6 , 7, 8])
+    True
+    >>>
+    """
+    return reduce(lambda a, b: a and b, mapl(function, array)) == True
+
+
+def some(function, array):
+    """
+    Returns true if any of the values in the list pass the predicate
+    truth test. Short-circuits and stops traversing the list if a true
+    element is found.
+
+    Example:
+
+    >>> from m2py import functional as f
+    >>> f.some(lambda x: x> 4, [1, 2, 3, 4])
+    False
+    >>> f.some(lambda x: x> 4, [1, 2, 3, 4, 5 ,6 , 7, 8])
+    True
+    >>>
+    """
+    return reduce(lambda a, b: a or b, mapl(function, array)) == True
+
+
+def unique(lst):
+    """
+    Remove repeated elements from an aray
+    """
+    return sort(set(lst))
+
+
+def reverse(array):
+    """
+    Return reversed array (list)
+
+    :param array: List or Tuple of values
+    :return:      Reversed array
+
+    >>> from m2py import functional as f
+    >>>
+    >>> f.reverse((1, 2, 3, 4, 5))
+    [5, 4, 3, 2, 1]
+    >>>
+    >>>
+    >>> f.reverse([1, 2, 3, 4, 5])
+    [5, 4, 3, 2, 1]
+    """
+    if is_list(array):
+        c = array.copy()
+    elif is_tuple(array):
+        c = list(array)
+    else:
+        raise Exception("Error: array must be tuple or list")
+
+    c.reverse()
+    return c
+
+
+def last(array):
+    """
+    Return the last element of a list
+    """
+    return array[-1]
+
+
+def first(array):
+    """
+    Return the first element of a list
+    """
+    return array[0]
+
+
+def nth(array, n):
+    """
+
+    nth(N, List) -> Elem
+
+    > lists:nth(3, [a, b, c, d, e]).
+    c
+
+    Idea from: http://erldocs.com/17.3/stdlib/lists.html
+    """
+    return array[n]
+
+
+def inc(x):
+    return x + 1
+
+
+def sort(array):
+    """
+
+    sort(List1) -> List2
+
+        List1 = List2 = [T]
+        T = term()
+
+    Returns a list containing the sorted elements of List1.
+
+    Idea from: http://erldocs.com/17.3/stdlib/lists.html
+    """
+    if is_list(array):
+        c = array.copy()
+    else:
+        c = list(array)
+
+    c.sort()
+    return c
+
+
+def sublist(list, start, len):
+    """
+    Returns the sub-list of List1 starting at Start and with (max) Len elements. It is not an error for Start+Len to exceed the length of the list.
+
+    >>> x
+    [-1, 2, 10, 23, 23.23]
+    >>> f.sublist(x, 1, 3)
+    [2, 10, 23]
+    >>> f.sublist(x, 2, 3)
+    [10, 23, 23.23]
+    >>>
+    >>>
+    """
+    return list[start:(start + len)]
+
+
+def is_allequal(List):
+    """
+    Test if all elements of
+    a list are the same.
+
+    return True  if all elements are equal
+    return False if elements are different
+    """
+    return all([x == List[0] for x in List])
+
+
+def duplicate(N, Elem):
+    """
+
+    N = integer() >= 0
+    Elem = T
+    List = [T]
+    T = term()
+
+    Returns a list which contains N copies of the term Elem. For example:
+
+    > lists:duplicate(5, xx).
+    [xx,xx,xx,xx,xx]
+
+    Note: Function taken from Erlang -
+    http://erldocs.com/17.3/stdlib/lists.html#duplicate
+    """
+    if hasattr(Elem, "copy"):
+        return [Elem.copy() for i in range(N)]
+    else:
+        return [Elem for i in range(N)]
+
+
+def copy(object):
+    """
+    Returns a clone of object
+
+    Note: From cloujure Language
+    http://docs.oracle.com/javase/6/docs/api/java/util/Vector.html#indexOf%28java.lang.Object%29
+    """
+
+    if hasattr(object, "copy"):
+        return object.copy()
+    else:
+        return object
+
+
+def append(*ListOfLists):
+    """
+    ListOfLists = [List]
+    List = List1 = [T]
+    T = term()
+
+    Returns a list in which all the sub-lists of ListOfLists have been appended. For example:
+
+    > lists:append([[1, 2, 3], [a, b], [4, 5, 6]]).
+    [1,2,3,a,b,4,5,6]
+
+    >>> from m2py import functional as f
+    >>> f.append([1, 2, 3], ['a', 'b'], [4, 5, 6])
+    [1, 2, 3, 'a', 'b', 4, 5, 6]
+
+    Note: Function taken from Erlang -
+    http://erldocs.com/17.3/stdlib/lists.html#append
+    """
+    newlist = []
+    mapl(lambda x: newlist.extend(x), ListOfLists)
+    return newlist
+
+
+def mapdict_values(function, dic):
+    """
+    Apply a function to a dictionary values,
+    creating a new dictionary with the same keys
+    and new values created by applying the function
+    to the old ones.
+
+    :param function: A function that takes the dictionary value as argument
+    :param dic:      A dictionary
+    :return:         A new dicitonary with same keys and values changed
+
+    Example:
+
+    >>> dic1 = { 'a' : 10, 'b' : 20, 'c' : 30 }
+    >>> mapdict_values(lambda x: x*2, dic1)
+    {'a': 20, 'b': 40, 'c': 60}
+    >>> dic1
+    {'a': 10, 'b': 20, 'c': 30}
+    """
+    return dict(map(lambda x: (x[0], function(x[1])), dic.items()))
+
+
+def mapdict_keys(function, dic):
+    """
+    Apply a function to a dictionary keys,
+    creating a new dictionary with the same values
+    and new values created by applying the function
+    to the old ones.
+
+    :param function: A function that takes the dictionary key as argument
+                      and returns a new dictionary key
+    :param dic:      A dictionary
+    :return:         A new dicitonary with same keys and values changed
+
+    Example:
+
+    >>> dic1 = { 'a' : 10, 'b' : 20, 'c' : 30 }
+    >>>
+    >>> mapdict_keys(lambda x: str(x) + "_hello", dic1)
+    {'a_hello': 10, 'b_hello': 20, 'c_hello': 30}
+    >>>
+    >>> dic1
+    {'a': 10, 'b': 20, 'c': 30}
+    """
+    return dict(map(lambda x: (function(x[0]), x[1]), dic.items()))
+
+
+def merge_dict(*dicts):
+    """
+    Merge a list of dictionaries returning a new one.
+    
+    :param dictionaries: A list of dictionaries
+    :return:             A new dicitonary
+    :rtype:              dict
+    """
+    dic = {}
+    for d in dicts:
+        if d is not None:
+            dic.update(d)
+    return dic
+
+
+def reverse_dict(dic):
+    """
+    
+    """
+    return dictzip(*reverse(unzip_l(dic.items())))
+
+
+
+
+def product(list):
+    """
+    Returns a product of a List
+
+    :param list:
+    :return:
+    """
+
+    prod = 1
+    for e in list:
+        prod = prod * e
+    return prod
+
+
+def get(property):
+    """
+    >>> user =  {'name': 'Bemmu', 'uid': '297200003'}
+    >>> get("name")(user)
+    'Bemmu'
+    """
+
+    def get_property(object):
+
+        if is_dict(object):
+            return object.get(property)
+        else:
+            return getattr(object, property)
+
+    return get_property
+
+
+def pluck(property):
+    """
+
+    This pattern of combining splat and get is very
+    frequent in JavaScript code.
+    So much so, that we can take it up another level:
+
+    :param property:
+    :return:
+    
+    Example:
+    
+   users = [
+       {
+       "name" : "Bemmu",
+       "uid" : "297200003"
+       },
+       {
+       "name" : "Zuck",
+       "uid" : "4"
+       }
+   ]   
+   >>> get_name = pluck("name")
+   >>> get_name(users)
+   ['Bemmu', 'Zuck']
+
+    
+    
+    
+    """
+
+    def fun(object_array):
+
+
+        if is_list(object_array):
+
+            if is_dict(object_array[0]):
+                out = map(lambda obj: obj.get(property), object_array)
+            else:
+                out = map(lambda obj: getattr(obj, property), object_array)
+        else:
+
+            if is_dict(object_array):
+                out = object_array.get(property)
+            else:
+                out = getattr(object_array, property)
+
+        return list(out)
+
+    return fun
+
+
+def printf(function):
+    def printer(*args, **kwargs):
+        print(function(*args, **kwargs))
+
+    return printer
+
+
+def take_while(predicate, List):
+    result = []
+    for e in List:
+        if not predicate(e):
+            return result
+        else:
+            result.append(e)
+
+
+def drop_while(predicate, List):
+    result = List.copy()
+
+    for e in List:
+        if not predicate(e):
+            return result.pop(0)
+        else:
+            result.pop(0)
+
+
+def once(func):
+    """
+    Once will create a function you can only run once. 
+    Subsequent invocations will return the first result.
+    """
+    cache = []
+    #def once_function(x):
+
+
+CacheInfo = collections.namedtuple("CacheInfo", "hits misses evictions maxsize currsize")
+
+_MISSING = object()
+_KWD_MARK = object()
+
+
+def make_key(args, kwargs, typed=False):
+    """
+    Make a hashable cache key from the positional and keyword
+    arguments of a function call.
+    """
+    key = args
+
+    if kwargs:
+        key += (_KWD_MARK,) + tuple(sorted(kwargs.items()))
+
+    if typed:
+        key += tuple(type(v) for v in args)
+        if kwargs:
+            key += tuple(type(v) for k, v in sorted(kwargs.items()))
+
+    return key
+
+
+class LRUStore(object):
+    """ Cache storage that evicts the least recently used entry """
+
+    def __init__(self):
+        self.data = collections.OrderedDict()
+
+    def get(self, key):
+        value = self.data.get(key, _MISSING)
+        if value is not _MISSING:
+            self.data.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+
+    def pop(self, key):
+        return self.data.pop(key)
+
+    def victim(self):
+        return next(iter(self.data))
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __len__(self):
+        return len(self.data)
+
+    def clear(self):
+        self.data.clear()
+
+
+class LFUStore(object):
+    """
+    Cache storage that evicts the least frequently used entry, the
+    least recently used among the entries with the same frequency.
+    All the operations are O(1).
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.freq = {}
+        self.buckets = collections.defaultdict(collections.OrderedDict)
+        self.min_freq = 0
+
+    def _touch(self, key):
+        f = self.freq[key]
+        bucket = self.buckets[f]
+        del bucket[key]
+
+        if not bucket:
+            del self.buckets[f]
+            if self.min_freq == f:
+                self.min_freq = f + 1
+
+        self.freq[key] = f + 1
+        self.buckets[f + 1][key] = None
+
+    def get(self, key):
+        value = self.data.get(key, _MISSING)
+        if value is not _MISSING:
+            self._touch(key)
+        return value
+
+    def set(self, key, value):
+        if key in self.data:
+            self.data[key] = value
+            self._touch(key)
+            return
+
+        self.data[key] = value
+        self.freq[key] = 1
+        self.buckets[1][key] = None
+        self.min_freq = 1
+
+    def pop(self, key):
+        f = self.freq.pop(key)
+        bucket = self.buckets[f]
+        del bucket[key]
+
+        if not bucket:
+            del self.buckets[f]
+            if self.min_freq == f:
+                self.min_freq = min(self.buckets) if self.buckets else 0
+
+        return self.data.pop(key)
+
+    def victim(self):
+        return next(iter(self.buckets[self.min_freq]))
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __len__(self):
+        return len(self.data)
+
+    def clear(self):
+        self.data.clear()
+        self.freq.clear()
+        self.buckets.clear()
+        self.min_freq = 0
+
+
+CACHE_POLICIES = {"lru": LRUStore, "lfu": LFUStore}
+
+
+def cache(maxsize=None, policy="lru", ttl=None, maxbytes=None, typed=False, single_flight=False):
+    """
+    Memoization decorator with bounded size, eviction policy and expiration.
+
+    :param maxsize:       Maximum number of entries, None for unbounded
+    :param policy:        Eviction policy "lru" (least recently used) or
+                          "lfu" (least frequently used)
+    :param ttl:           Time to live of the entries in seconds, the
+                          expired entries are removed on each insert
+    :param maxbytes:      Maximum size of the cached values in bytes
+                          (shallow size measured with sys.getsizeof)
+    :param typed:         Cache arguments of different types separately
+    :param single_flight: If True, concurrent calls with the same key wait
+                          for the first one instead of computing it again.
+    :return:              Decorator
+
+    The decorated function has the methods cache_info() and cache_clear().
+    All the arguments must be hashable. The cache is thread-safe.
+
+    Example:
+
+    >>> @cache(maxsize=1000, ttl=60, single_flight=True)
+    ... def fetch(url, timeout=10):
+    ...     return download(url, timeout)
+    >>>
+    >>> fetch.cache_info()
+    CacheInfo(hits=0, misses=0, evictions=0, maxsize=1000, currsize=0)
+    """
+    if policy not in CACHE_POLICIES:
+        raise ValueError("Unknown cache policy: {}".format(policy))
+
+    def decorator(func):
+        store = CACHE_POLICIES[policy]()
+        sizes = {}
+        # Keys in the order they expire, all the entries have the same ttl
+        expiry = collections.OrderedDict()
+        lock = threading.RLock()
+        inflight = {}
+        stats = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0}
+
+        def lookup(key):
+            with lock:
+                entry = store.get(key)
+
+                if entry is not _MISSING:
+                    value, expires = entry
+
+                    if expires is None or expires > time.time():
+                        stats["hits"] += 1
+                        return value
+
+                    remove(key)
+
+                stats["misses"] += 1
+                return _MISSING
+
+        def remove(key):
+            store.pop(key)
+            expiry.pop(key, None)
+            stats["bytes"] -= sizes.pop(key, 0)
+
+        def purge_expired(now):
+            while expiry:
+                key, expires = next(iter(expiry.items()))
+                if expires > now:
+                    break
+                remove(key)
+
+        def full(size):
+            return ((maxsize is not None and len(store) >= maxsize) or
+                    (maxbytes is not None and stats["bytes"] + size > maxbytes))
+
+        def insert(key, value):
+            now = time.time()
+            expires = None if ttl is None else now + ttl
+            size = 0 if maxbytes is None else sys.getsizeof(value)
+
+            with lock:
+                if key in store:
+                    remove(key)
+
+                if ttl is not None:
+                    purge_expired(now)
+
+                # Evict before inserting, so the new entry is never the victim
+                while len(store) and full(size):
+                    remove(store.victim())
+                    stats["evictions"] += 1
+
+                if maxsize is not None and maxsize <= 0:
+                    return
+
+                store.set(key, (value, expires))
+
+                if ttl is not None:
+                    expiry[key] = expires
+
+                if maxbytes is not None:
+                    sizes[key] = size
+                    stats["bytes"] += size
+
+        def compute(key, args, kwargs):
+            if not single_flight:
+                value = func(*args, **kwargs)
+                insert(key, value)
+                return value
+
+            with lock:
+                future = inflight.get(key)
+                owner = future is None
+
+                if owner:
+                    future = inflight[key] = Future()
+
+            if not owner:
+                return future.result()
+
+            try:
+                value = func(*args, **kwargs)
+                insert(key, value)
+                future.set_result(value)
+                return value
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with lock:
+                    del inflight[key]
+
+        @functools.wraps(func)
+        def cached(*args, **kwargs):
+            key = make_key(args, kwargs, typed)
+            value = lookup(key)
+
+            if value is _MISSING:
+                value = compute(key, args, kwargs)
+
+            return value
+
+        def cache_info():
+            with lock:
+                return CacheInfo(stats["hits"], stats["misses"], stats["evictions"],
+                                 maxsize, len(store))
+
+        def cache_clear():
+            with lock:
+                store.clear()
+                sizes.clear()
+                expiry.clear()
+                stats.update(hits=0, misses=0, evictions=0, bytes=0)
+
+        cached.cache_info = cache_info
+        cached.cache_clear = cache_clear
+        return cached
+
+    return decorator
+
+
+def lru_cache(maxsize=128, typed=False):
+    """ Memoization decorator with least recently used eviction """
+    return cache(maxsize, "lru", typed=typed)
+
+
+def lfu_cache(maxsize=128, typed=False):
+    """ Memoization decorator with least frequently used eviction """
+    return cache(maxsize, "lfu", typed=typed)
+
+
+def ttl_cache(ttl, maxsize=None, typed=False):
+    """ Memoization decorator where the entries expire after ttl seconds """
+    return cache(maxsize, "lru", ttl=ttl, typed=typed)
+
+
+def memoize(func):
+    """
+    Unbounded memoization of a function, the arguments must be
+    hashable. Falsy results (0, "", None) are cached as well.
+    See cache() for bounded caches.
+    """
+    return cache()(func)
+
+
+def fibbonaci(n):
+    if n > 2:
+        return fibbonaci(n - 1) + fibbonaci(n - 2)
+    else:
+        return 1
+
+
+def __fib(n):
+    if n > 2:
+
+        c = __fib.cache.get(n)
+        if c:
+            return c
+
+        a = __fib.cache.get(n - 1)
+        b = __fib.cache.get(n - 2)
+
+        if not a:
+            a = __fib(n - 1)
+            __fib.cache[n - 1] = a
+
+        if not b:
+            b = __fib(n - 2)
+            __fib.cache[n - 2] = b
+
+        c = a + b
+        __fib.cache[n] = c
+        return c
+    else:
+        return 1
+
+
+__fib.cache = {}
+
+
+def fib(n):
+    if not __fib.cache.get(n - 1):
+        mapl(__fib, range(n))
+    return __fib(n)
+
+
+def maplx_factory(function):
+    """
+    Example:
+
+    >>> from m2py import functional as f
+    >>>
+    >>> def fun(a, b, c): return a**2 - 10*b + c
+    ...
+    >>>
+    >>> fun_v = f.maplx_factory(fun)
+    >>>
+    >>> fun_v( [(0, 2, 4), (-3, 4, 8), (4, 2, 5), (22, -10, 23)] )
+    [-16, -23, 1, 607]
+    >>>
+    >>> fun_v((0, 2, 4))
+    -16
+    >>> fun_v((-3, 4, 8))
+    -23
+    >>> fun_v((4, 2, 5))
+    1
+    """
+
+    def f(x):
+        if is_tuple(x):
+            return function(*x)
+
+        elif is_list(x):
+            return maplx(function, x)
+        raise Exception("Argument must be tuple or List")
+
+    return f
+
+
+def vectorize_juxt(funclist):
+    """
+
+    Example:
+
+    >>> from m2py import functional as f
+    >>>
+    >>> f1 = lambda x: x**2 - 10.0
+    >>> f2 = lambda x: 10*x + 8
+    >>> f3 = lambda x: 100.0/x - 4
+    >>>
+    >>> x = [1, 2, 3, 4, 5]
+    >>>
+    >>>
+    >>> fv= f.vectorize_juxt([f1, f2, f3])
+    >>> fv(x)
+    [[-9.0, -6.0, -1.0, 6.0, 15.0],
+     [18, 28, 38, 48, 58],
+     [96.0, 46.0, 29.333333333333336, 21.0, 16.0]]
+    """
+    f = lambda x: juxt(funclist, x)
+    return f
+
+
+def vectorize(function):
+    """
+    :param function: Function to be vectorized
+    :return:         Vectorized function
+
+    Create new function y= vf(x), such that:
+
+    y = f(x)
+
+        /  map(f, x)  if x is list
+    vf =
+        \  f(x)       if x is not list
+
+    Example:
+
+    >>> from m2py import functional as f
+    >>> import math
+    >>>
+    >>> sqrt = f.vectorize(math.sqrt)
+    >>> sqrt(2)
+    1.4142135623730951
+    >>>
+    >>> sqrt([1, 2, 3, 4, 5])
+    [1.0, 1.4142135623730951, 1.7320508075688772, 2.0, 2.23606797749979]
+    """
+
+    def vectorized_function(x):
+        if isinstance(x, list):
+            return list(map(function, x))
+        return function(x)
+
+    return vectorized_function
+
+
+def vectorize_var(function, variable, **constants):
+    """
+    Create a vectorized curried function
+
+    :param function:  Function
+    :param variable:  Variable symbol (str), free parameter
+    :param constants: Constant parameters dictionary
+    :return:          Curried function
+
+
+    Example:
+    Currying - Create a new function fun_x(x) from f(x)
+    such that fun_x(x) = fun(x, y=2, z=3)
+
+    >>> def fun(x, y, z): return x**2 - y*z
+    ...
+    >>> fun_vx = f.vectorize_var(fun, "x", y=2, z=3)
+    >>>
+    >>> fun_vx([2, 3, 4, 5, 7])
+    [-2, 3, 10, 19, 43]
+    >>>
+    """
+    fv = currying(function, variable, **constants)
+    fv = vectorize(fv)
+    return fv
+
+
+def vectorize_dec():
+    """
+    Vectorize decorator
+
+    Example:
+
+    import functional as f
+
+    @f.vectorize_dec()
+    def signum(x):
+        if x > 0:
+            return 1
+        elif x < 0:
+            return -1
+        else:
+            return 0
+
+    >>> signum([1, 2, -23, 0, -4.23, 23])
+    [1, 1, -1, 0, -1, 1]
+    >>>
+    >>> signum(10)
+    1
+    >>> signum(-10)
+    -1
+    >>> signum(0)
+    0
+    >>>
+    """
+    import functools
+
+    def wrap(f):
+        @functools.wraps(f)
+        def wrapper(x):
+            if is_list(x):
+                return list(map(f, x))
+            else:
+                return f(x)
+
+        return wrapper
+
+    return wrap
+
+
+def equalize(*args):
+    """
+    Similar to copy the non constants elemements
+    of an spreadsheet to the other rows.
+
+    x   y   z   w           x   y  z  w
+    1   -2  8   6           1  -2  8  6
+    2   -1                  2  -1  8  6
+    3   0                   3   0  8  6
+    4   1          ===>     4   1  8  6
+    5   2                   5   2  8  6
+    6   3                   6   3  8  6
+
+    Example:
+
+    >>> from m2py.functional.vectorize import equalize
+    >>> equalize([1, 2, 3, 4, 5, 6], [-2, -1, 0, 1, 2, 3], 8, 6)
+    [[1, 2, 3, 4, 5, 6], [-2, -1, 0, 1, 2, 3], [8, 8, 8, 8, 8, 8], [6, 6, 6, 6, 6, 6]]
+
+    Note: I don't have a good name to this function yiet.
+    """
+    args = list(args)
+    v = find(is_list, args)
+    if v is not None:
+        N = len(v)
+        columns = mapif(is_num, lambda x: duplicate(N, x), args)
+    else:
+        columns = args
+    return columns
+
+
+def vectorize_args(function):
+    """
+    Creates a new function that accepts
+    array or number as input.
+    This function is Useful for spreadsheet
+    like numerical computations.
+
+
+    Example:
+
+    f(x , y , z, w) = x*y – 10*z + w
+
+    x   y   z   w   f(x, y, z=8, w=6)
+    1   -2  8   6   -76
+    2   -1  8   6   -76
+    3   0   8   6   -74
+    4   1   8   6   -70
+    5   2   8   6   -64
+    6   3   8   6   -56
+
+
+    >>> from m2py.functional.vectorize import vectorize_args
+    >>> x = [  1,  2, 3, 4, 5, 6 ]
+    >>> y = [ -2, -1, 0, 1, 2, 3 ]
+    >>> z = 8
+    >>> w = 6
+    >>>
+    >>> def f(x, y, z, w): return x*y - 10*z + w
+    ...
+    >>>
+    >>> mf = vectorize_args(f)
+    >>>
+    >>> mf(x, y, z, w)
+    [-76, -76, -74, -70, -64, -56]
+    >>>
+    """
+
+    def func(*args):
+        columns = equalize(*args)
+        return maplx(function, list(zip(*columns)))
+
+    return func
+
+
+def get_column(matrix, column):
+    """
+    Get the column of a matrix ( List ) composed
+    of list or tuple that represents each row of
+    a matrix.
+
+    :param matrix:  List cotaining [ row0, row1, ... rown]  where row_i = [ ai0, ai1, ai2, ... ain]
+    :param column:  Column number ( Example: k to get column k)
+    :return:        Column k or  [ a0k, a1k, a2k, ... aMk ]
+
+    Example:
+
+    x   y   z
+    5   43  83
+    52  99  70
+    78  27  86
+    26  84  49
+
+
+    Represented as:
+
+    [
+    (x0, y0, z0),
+    (x1, y2, z1),
+    (x2, y2, z2),
+    ...
+    (xn, yn, zn)
+    ]
+
+    [(5,  43, 83),
+     (52, 99, 70),
+     (78, 27, 86),
+     (26, 84, 49),]
+
+    Each List
+    >>> M = [(5.0, 52.0, 78.0, 26.0), (43.0, 99.0, 27.0, 84.0), (83.0, 70.0, 86.0, 49.0)]
+    >>> get_column(M, 0)
+    [5.0, 43.0, 83.0]
+    >>> get_column(M, 1)
+    [52.0, 99.0, 70.0]
+    >>> get_column(M, 2)
+    [78.0, 27.0, 86.0]
+    >>> get_column(M, 3)
+    [26.0, 84.0, 49.0]
+
+    """
+
+    return list(map(lambda e: e[column], matrix))
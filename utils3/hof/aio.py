@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Asyncio Higher Order Functions
+
+Counterparts of the hof combinators that run coroutines on the event
+loop instead of threads. The functions passed to them can be coroutine
+functions or plain functions.
+
+Example:
+
+    >>> import asyncio
+    >>> from utils3.hof.aio import amap
+    >>>
+    >>> async def fetch(url):
+    ...     await asyncio.sleep(0.1)
+    ...     return url.upper()
+    >>>
+    >>> asyncio.run(amap(fetch, ["a", "b", "c"], concurrency=100))
+    ['A', 'B', 'C']
+"""
+
+import asyncio
+import inspect
+import itertools
+import time
+
+from . import RetryPolicy
+
+
+async def resolve(value):
+    """ Await value if it is awaitable, otherwise return it unchanged """
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def aiterate(sequence):
+    """ Iterate over a sequence or an async iterable """
+    if hasattr(sequence, "__aiter__"):
+        async for x in sequence:
+            yield x
+    else:
+        for x in sequence:
+            yield x
+
+
+async def amap(function, sequence, concurrency=None):
+    """
+    Map a coroutine function to a sequence with at most concurrency
+    calls running at the same time.
+
+    :param function:    Coroutine function or function
+    :param sequence:    List, iterable or async iterable of values
+    :param concurrency: Maximum number of pending calls (default: unbounded)
+    :return:            List of results in the order of the sequence
+
+    If a call fails the other pending calls are cancelled and the
+    exception is raised.
+    """
+    if concurrency is not None and concurrency < 1:
+        raise ValueError("concurrency must be at least 1: {!r}".format(concurrency))
+
+    if concurrency is None:
+        items = [x async for x in aiterate(sequence)]
+        tasks = [asyncio.ensure_future(resolve(function(x))) for x in items]
+
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    results = {}
+    source = aiterate(sequence).__aiter__()
+    lock = asyncio.Lock()
+
+    async def worker():
+        while True:
+            async with lock:
+                try:
+                    index = len(results)
+                    x = await source.__anext__()
+                    results[index] = None
+                except StopAsyncIteration:
+                    return
+
+            results[index] = await resolve(function(x))
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+
+    return [results[i] for i in range(len(results))]
+
+
+async def afilter(predicate, sequence, concurrency=None):
+    """
+    Return the elements of the sequence that satisfy the predicate,
+    the predicate can be a coroutine function.
+    """
+    items = [x async for x in aiterate(sequence)]
+    flags = await amap(predicate, items, concurrency)
+    return [x for x, flag in zip(items, flags) if flag]
+
+
+async def aretry(call, tries=3, errors=Exception, delay=0, backoff=2, max_delay=None,
+                 policy=None, **options):
+    """
+    Await call() until it succeeds or the tries are exhausted, sleeping
+    on the event loop between the attempts.
+
+    :param call:      Coroutine function or function without arguments
+    :param tries:     Maximum number of attempts
+    :param errors:    Exception or tuple of exceptions that are retried
+    :param delay:     Seconds to wait after the first failure
+    :param backoff:   Multiplier of the delay after each failure
+    :param max_delay: Upper bound of the delay
+    :param policy:    hof.RetryPolicy, if given the other parameters are
+                      ignored. The same policy can be used by hof.retry.
+    :param options:   Other RetryPolicy parameters (jitter, deadline,
+                      retry_on, breaker, on_retry, on_giveup)
+
+    Example:
+
+    >>> await aretry(lambda: client.get(url), tries=5, errors=IOError, delay=0.1)
+    """
+    if policy is None:
+        policy = RetryPolicy(tries, errors, delay, backoff, max_delay, **options)
+
+    started = time.monotonic()
+
+    for attempt in itertools.count(1):
+        policy.before(attempt)
+
+        try:
+            result = await resolve(call())
+        except BaseException as error:
+            wait = policy.outcome(attempt, started, error=error)
+        else:
+            wait = policy.outcome(attempt, started, result=result)
+
+            if wait is None:
+                return result
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def apipe(*funclist):
+    """
+    Returns a coroutine function that applies the functions from left
+    to right, awaiting the results of the coroutine functions.
+
+    >>> parse_page = apipe(fetch, decode, extract_links)
+    >>> links = await parse_page(url)
+    """
+
+    async def f(x):
+        _x = x
+
+        for f in funclist:
+            _x = await resolve(f(_x))
+
+        return _x
+
+    return f
+
+
+def acompose(*funclist):
+    """
+    Returns a coroutine function that applies the functions from right
+    to left, like hof.compose.
+    """
+    return apipe(*reversed(funclist))
+
+
+async def gather_bounded(awaitables, limit, return_exceptions=False):
+    """
+    Like asyncio.gather but at most limit awaitables run at the same time.
+
+    :param awaitables:        List of coroutines or futures
+    :param limit:             Maximum number of awaitables running
+    :param return_exceptions: Return the exceptions as results instead
+                              of raising the first one.
+    :return:                  List of results in the order of awaitables
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1: {!r}".format(limit))
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(aw):
+        async with semaphore:
+            return await aw
+
+    return list(await asyncio.gather(*[bounded(aw) for aw in awaitables],
+                                     return_exceptions=return_exceptions))
@@ -5,10 +5,15 @@ Linux Helpers and Tools
 
 """
 import os
+import re
+import select
+import struct
+import ctypes
+import ctypes.util
+
 from . import Path
 from .check import is_none
 from .hof import mapdict_values
-import re
 
 
 HOME = Path.home().path
@@ -33,7 +38,12 @@ def get_xdg_user_dir():
          'XDG_VIDEOS_DIR': '/home/tux/Videos'}
     """
 
-    user_dirs = Path.home().get(".config/user-dirs.dirs").read()
+    user_dirs_file = Path.home().get(".config/user-dirs.dirs")
+
+    if not user_dirs_file.is_file():
+        return {}
+
+    user_dirs = user_dirs_file.read()
     key_values = re.findall('(^XDG.*)="(.*)"', user_dirs, re.M)
     xdg_dirs = mapdict_values(lambda p: p.replace("$HOME", HOME), dict(key_values))
     return xdg_dirs
@@ -109,3 +119,110 @@ class DesktopEntry(object):
 
         return txt
 
+
+#-------------------------------#
+#           INOTIFY             #
+#-------------------------------#
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+IN_ALL_CHANGES = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+                  IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class Inotify(object):
+    """
+    Minimal ctypes binding to the Linux inotify API.
+
+    Example:
+
+        >>> with Inotify() as ino:
+        ...     ino.add_watch("/tmp")
+        ...     for wd, mask, cookie, name in ino.read_events(timeout=5):
+        ...         print(ino.watches[wd], name, hex(mask))
+    """
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        self.watches = {}
+
+    def add_watch(self, path, mask=IN_ALL_CHANGES):
+        """ Watch a directory, returns the watch descriptor """
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path)
+
+        self.watches[wd] = path
+        return wd
+
+    def rm_watch(self, wd):
+        self._libc.inotify_rm_watch(self.fd, wd)
+        self.watches.pop(wd, None)
+
+    def read_events(self, timeout=None):
+        """
+        Wait up to timeout seconds for events and return them as a list
+        of (wd, mask, cookie, name) tuples.
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+
+        if not readable:
+            return []
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events = []
+        offset = 0
+
+        while offset < len(data):
+            wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+
+            events.append((wd, mask, cookie, name))
+
+        return events
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Persistent file metadata cache.
+
+The content hashes of files are stored in a sqlite database and
+validated with (st_dev, st_ino, st_mtime_ns, st_size), so repeated
+scans of the same tree only read again the files that have changed.
+
+Example:
+
+    >>> from utils3 import Path
+    >>> from utils3.statcache import StatCache
+    >>>
+    >>> cache = StatCache("/var/cache/artifacts.db")
+    >>> manifest = Path("/data/artifacts").hash_tree("sha256", parallel=8, cache=cache)
+    >>> cache.info()
+    {'hits': 2998112, 'misses': 1204, 'evictions': 0, 'entries': 3000000}
+"""
+import os
+import sqlite3
+import threading
+
+from .Container import Container
+from .Path import hash_file
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    path     TEXT    NOT NULL,
+    algo     TEXT    NOT NULL,
+    dev      INTEGER NOT NULL,
+    ino      INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size     INTEGER NOT NULL,
+    digest   TEXT    NOT NULL,
+    used     INTEGER NOT NULL,
+    PRIMARY KEY (path, algo)
+);
+CREATE INDEX IF NOT EXISTS hashes_used ON hashes (used);
+"""
+
+COMMIT_EVERY = 1000
+
+
+def stat_key(st):
+    """ Return the tuple that identifies a version of a file """
+    return st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size
+
+
+class StatCache(object):
+    """
+    sqlite backed cache of file content hashes.
+
+    :param filename:    Database file, ":memory:" for a cache that is
+                        not persisted.
+    :param max_entries: Maximum number of entries, the least recently
+                        used entries are evicted when it is exceeded.
+
+    The cache can be shared by threads.
+    """
+
+    def __init__(self, filename=":memory:", max_entries=1000000):
+        self.filename = filename
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._clock = 0
+        self._pending = 0
+        self._db = sqlite3.connect(filename, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+
+        row = self._db.execute("SELECT MAX(used) FROM hashes").fetchone()
+        self._clock = row[0] or 0
+
+    def _tick(self):
+        self._clock += 1
+        return self._clock
+
+    def lookup(self, path, algo="md5", st=None):
+        """
+        Return the cached digest of path or None if the file
+        changed or is not in the cache.
+        """
+        path = os.path.abspath(str(path))
+
+        if st is None:
+            st = os.stat(path)
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT dev, ino, mtime_ns, size, digest FROM hashes WHERE path = ? AND algo = ?",
+                (path, algo)).fetchone()
+
+            if row is None or tuple(row[:4]) != stat_key(st):
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._db.execute("UPDATE hashes SET used = ? WHERE path = ? AND algo = ?",
+                             (self._tick(), path, algo))
+            return row[4]
+
+    def store(self, path, algo, digest, st):
+        """ Store the digest of path computed when its stat was st """
+        path = os.path.abspath(str(path))
+
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                             (path, algo) + stat_key(st) + (digest, self._tick()))
+            self._pending += 1
+
+            if self._pending >= COMMIT_EVERY:
+                self._evict()
+                self._db.commit()
+                self._pending = 0
+
+    def hash(self, path, algo="md5"):
+        """
+        Return the hex digest of the file content, reading the file
+        only if it is not in the cache or has changed.
+        """
+        st = os.stat(str(path))
+        digest = self.lookup(path, algo, st)
+
+        if digest is None:
+            digest = hash_file(str(path), algo)
+            self.store(path, algo, digest, st)
+
+        return digest
+
+    def _evict(self):
+        count = self._db.execute("SELECT COUNT(*) FROM hashes").fetchone()[0]
+        excess = count - self.max_entries
+
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM hashes WHERE rowid IN "
+                "(SELECT rowid FROM hashes ORDER BY used LIMIT ?)", (excess,))
+            self.evictions += excess
+
+    def invalidate(self, path):
+        """ Remove path and, if it is a directory, everything below it """
+        path = os.path.abspath(str(path))
+        prefix = path.rstrip(os.sep) + os.sep
+
+        with self._lock:
+            self._db.execute("DELETE FROM hashes WHERE path = ? OR substr(path, 1, ?) = ?",
+                             (path, len(prefix), prefix))
+            self._db.commit()
+
+    def clear(self):
+        """ Remove all entries and reset the counters """
+        with self._lock:
+            self._db.execute("DELETE FROM hashes")
+            self._db.commit()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        self.flush()
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM hashes").fetchone()[0]
+
+    def info(self):
+        """ Return the hit, miss and eviction counters """
+        return Container(hits=self.hits, misses=self.misses,
+                         evictions=self.evictions, entries=len(self))
+
+    def flush(self):
+        """ Evict the excess entries and write the pending changes to disk """
+        with self._lock:
+            self._evict()
+            self._db.commit()
+            self._pending = 0
+
+    def close(self):
+        self.flush()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()